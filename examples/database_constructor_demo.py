@@ -73,10 +73,12 @@ async def read_write_split_demo():
     print("\n🔀 读写分离演示:")
     print("=" * 30)
     
-    # 读写分离配置
+    # 读写分离配置：主从指向同一个共享缓存的内存库，模拟已完成复制的从库，
+    # 演示过程不落盘
+    memory_url = "sqlite+aiosqlite:///file:rw_demo?mode=memory&cache=shared&uri=true"
     config = {
-        "write": "sqlite+aiosqlite:///master.db",
-        "read": "sqlite+aiosqlite:///slave.db"
+        "write": memory_url,
+        "read": memory_url
     }
     
     db = Database(config)
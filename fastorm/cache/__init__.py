@@ -8,6 +8,9 @@ FastORM 缓存模块
 - 装饰器：便捷的函数缓存
 """
 
+import asyncio
+import inspect
+
 from .backends import MemoryBackend
 from .backends import RedisBackend
 from .decorators import cache_method
@@ -104,6 +107,10 @@ def get_cache() -> CacheManager:
 
 # Laravel风格的便捷函数
 
+# (事件循环, remember键) -> 加载任务，用于合并同一事件循环内并发的缓存未命中；
+# 任务绑定所属的事件循环，不能被其他循环中的调用者等待
+_inflight: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Task] = {}
+
 
 async def remember(key: str, ttl: int, callback, tags: set = None):
     """Laravel风格的remember函数
@@ -131,16 +138,50 @@ async def remember(key: str, ttl: int, callback, tags: set = None):
     if cached_value is not None:
         return cached_value
 
-    # 执行回调函数
-    if asyncio.iscoroutinefunction(callback):
-        value = await callback()
-    else:
+    # 同一个键的并发未命中只执行一次回调，其余调用等待同一个加载任务
+    inflight_key = (asyncio.get_running_loop(), key)
+    task = _inflight.get(inflight_key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _load_and_remember(inflight_key, ttl, callback, tags)
+        )
+        task.add_done_callback(_retrieve_exception)
+        _inflight[inflight_key] = task
+
+    # shield：某个等待者被取消时不影响加载任务和其他等待者
+    return await asyncio.shield(task)
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    """取走加载任务的异常
+
+    等待者全部被取消时没有人读取被 shield 的任务结果，
+    避免事件循环报告 "exception was never retrieved"。
+    """
+    if not task.cancelled():
+        task.exception()
+
+
+async def _load_and_remember(
+    inflight_key: tuple[asyncio.AbstractEventLoop, str],
+    ttl: int,
+    callback,
+    tags: set = None,
+):
+    """执行回调并写入缓存（remember的单次加载过程）"""
+    key = inflight_key[1]
+    try:
+        # 执行回调函数（兼容返回协程的普通函数，如lambda）
         value = callback()
+        if inspect.isawaitable(value):
+            value = await value
 
-    # 设置缓存
-    await cache.set(key, value, ttl, tags)
+        # 设置缓存
+        await cache.set(key, value, ttl, tags)
 
-    return value
+        return value
+    finally:
+        _inflight.pop(inflight_key, None)
 
 
 async def forget(key: str) -> bool:
@@ -176,6 +217,3 @@ async def flush(*tags: str) -> int:
         total_count += count
     return total_count
 
-
-# 为了兼容性，导入asyncio
-import asyncio
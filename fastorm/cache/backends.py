@@ -4,8 +4,11 @@ FastORM 缓存后端实现
 支持内存缓存和Redis缓存。
 """
 
+from __future__ import annotations
+
 import logging
 import pickle
+import sys
 import time
 from abc import ABC
 from abc import abstractmethod
@@ -15,9 +18,12 @@ from typing import Any
 logger = logging.getLogger("fastorm.cache")
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
-    """缓存条目"""
+    """缓存条目
+
+    每个缓存值对应一个条目，使用 ``__slots__`` 省去实例 ``__dict__``。
+    """
 
     value: Any
     expires_at: float
@@ -58,56 +64,140 @@ class CacheBackend(ABC):
         """根据标签失效缓存"""
         pass
 
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        """批量获取缓存值，按keys顺序返回，未命中为None"""
+        return [await self.get(key) for key in keys]
+
+    async def set_many(
+        self, items: dict[str, Any], ttl: int = 300, tags: set[str] | None = None
+    ) -> bool:
+        """批量设置缓存值，所有条目共用同一TTL和标签"""
+        results = [
+            await self.set(key, value, ttl, tags) for key, value in items.items()
+        ]
+        return all(results)
+
 
 class MemoryBackend(CacheBackend):
-    """内存缓存后端"""
+    """内存缓存后端
+
+    容量满时按CLOCK（SIEVE式访问位）策略淘汰：每个条目占用环形槽位中的一格，
+    命中时只置位访问标记；淘汰指针跳过并清除已访问的槽位，淘汰第一个未访问
+    或已过期的条目。读路径不做任何重排，淘汰均摊O(1)。
+    """
+
+    # 共享标签集合池的容量上限
+    _TAG_SET_POOL_SIZE = 1024
 
     def __init__(self, max_size: int = 1000):
         self.max_size = max_size
         self._cache: dict[str, CacheEntry] = {}
         self._tag_mappings: dict[str, set[str]] = {}  # tag -> keys
-        self._key_tags: dict[str, set[str]] = {}  # key -> tags
+        self._key_tags: dict[str, frozenset[str]] = {}  # key -> tags
+        self._tag_sets: dict[frozenset[str], frozenset[str]] = {}  # 标签集合池
+        self._reset_slots()
+
+    def _reset_slots(self) -> None:
+        """初始化淘汰环"""
+        self._slots: list[str | None] = [None] * self.max_size  # 槽位 -> key
+        self._visited = bytearray(self.max_size)  # 槽位访问标记
+        self._key_slots: dict[str, int] = {}  # key -> 槽位
+        self._free_slots = list(range(self.max_size - 1, -1, -1))
+        self._hand = 0
 
     async def get(self, key: str) -> Any | None:
         """获取缓存值"""
-        if key not in self._cache:
-            return None
+        return self._get(key, time.time())
 
-        entry = self._cache[key]
-        if entry.is_expired():
-            await self.delete(key)
-            return None
+    def get_nowait(self, key: str) -> Any | None:
+        """同步获取缓存值
 
-        return entry.value
+        内存后端不涉及I/O，调用方可直接同步读取，省去协程的创建和调度。
+        """
+        return self._get(key, time.time())
+
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        """批量获取缓存值，只读取一次时钟"""
+        now = time.time()
+        return [self._get(key, now) for key in keys]
 
     async def set(
         self, key: str, value: Any, ttl: int = 300, tags: set[str] | None = None
     ) -> bool:
         """设置缓存值"""
-        # 检查容量限制
-        if len(self._cache) >= self.max_size and key not in self._cache:
-            # 清理过期条目
-            await self._cleanup_expired()
-
-            # 如果仍然超出限制，删除最旧的条目
-            if len(self._cache) >= self.max_size:
-                oldest_key = min(
-                    self._cache.keys(), key=lambda k: self._cache[k].expires_at
-                )
-                await self.delete(oldest_key)
-
-        # 删除旧的标签映射
-        if key in self._key_tags:
-            old_tags = self._key_tags[key]
-            for tag in old_tags:
-                if tag in self._tag_mappings:
-                    self._tag_mappings[tag].discard(key)
-                    if not self._tag_mappings[tag]:
-                        del self._tag_mappings[tag]
-            del self._key_tags[key]
+        return self.set_nowait(key, value, ttl, tags)
 
-        # 创建缓存条目
+    def set_nowait(
+        self, key: str, value: Any, ttl: int = 300, tags: set[str] | None = None
+    ) -> bool:
+        """同步设置缓存值"""
+        self._set(key, value, time.time() + ttl, self._intern_tags(tags))
+        return True
+
+    async def set_many(
+        self, items: dict[str, Any], ttl: int = 300, tags: set[str] | None = None
+    ) -> bool:
+        """批量设置缓存值，TTL和标签只处理一次"""
+        tags = self._intern_tags(tags)
         expires_at = time.time() + ttl
+        for key, value in items.items():
+            self._set(key, value, expires_at, tags)
+        return True
+
+    def _intern_tags(self, tags: set[str] | None) -> frozenset[str] | None:
+        """把标签集合转换为共享的frozenset
+
+        标签字符串驻留为同一对象，标签索引查找可先按身份比较；等价的标签集合
+        共用同一个frozenset（哈希值只计算一次），同时与调用方传入的可变集合
+        解耦。
+        """
+        if not tags:
+            return None
+
+        pool = self._tag_sets
+        if isinstance(tags, frozenset) and tags in pool:
+            return pool[tags]
+
+        frozen = frozenset(map(sys.intern, tags))
+        if len(pool) >= self._TAG_SET_POOL_SIZE:
+            # 仅用于去重，超出上限时直接重建
+            pool.clear()
+        return pool.setdefault(frozen, frozen)
+
+    def _get(self, key: str, now: float) -> Any | None:
+        """读取条目并标记访问"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        if now > entry.expires_at:
+            self._remove(key)
+            return None
+
+        self._visited[self._key_slots[key]] = 1
+        return entry.value
+
+    def _set(
+        self,
+        key: str,
+        value: Any,
+        expires_at: float,
+        tags: frozenset[str] | None,
+    ) -> None:
+        """写入条目，必要时淘汰"""
+        if key in self._cache:
+            # 覆盖已有条目：沿用原槽位，视为一次访问
+            self._unlink_tags(key)
+            self._visited[self._key_slots[key]] = 1
+        else:
+            # 容量已满时淘汰一个条目，腾出槽位
+            if not self._free_slots:
+                self._evict()
+            slot = self._free_slots.pop()
+            self._slots[slot] = key
+            self._key_slots[key] = slot
+
+        # 创建缓存条目
         entry = CacheEntry(value=value, expires_at=expires_at, tags=tags)
         self._cache[key] = entry
 
@@ -119,26 +209,12 @@ class MemoryBackend(CacheBackend):
                     self._tag_mappings[tag] = set()
                 self._tag_mappings[tag].add(key)
 
-        return True
-
     async def delete(self, key: str) -> bool:
         """删除缓存值"""
         if key not in self._cache:
             return False
 
-        # 删除缓存条目
-        del self._cache[key]
-
-        # 删除标签映射
-        if key in self._key_tags:
-            tags = self._key_tags[key]
-            for tag in tags:
-                if tag in self._tag_mappings:
-                    self._tag_mappings[tag].discard(key)
-                    if not self._tag_mappings[tag]:
-                        del self._tag_mappings[tag]
-            del self._key_tags[key]
-
+        self._remove(key)
         return True
 
     async def clear(self) -> bool:
@@ -146,28 +222,63 @@ class MemoryBackend(CacheBackend):
         self._cache.clear()
         self._tag_mappings.clear()
         self._key_tags.clear()
+        self._tag_sets.clear()
+        self._reset_slots()
         return True
 
     async def invalidate_tag(self, tag: str) -> int:
         """根据标签失效缓存"""
-        if tag not in self._tag_mappings:
+        # _remove 会修改标签映射，先取出该标签下的键集合
+        keys_to_delete = self._tag_mappings.pop(sys.intern(tag), None)
+        if not keys_to_delete:
             return 0
 
-        keys_to_delete = self._tag_mappings[tag].copy()
-        count = 0
-
         for key in keys_to_delete:
-            if await self.delete(key):
-                count += 1
+            self._remove(key)
+
+        return len(keys_to_delete)
+
+    def _evict(self) -> None:
+        """推进淘汰指针，淘汰第一个未访问或已过期的条目"""
+        slots = self._slots
+        visited = self._visited
+        hand = self._hand
+        now = time.time()
+
+        while True:
+            key = slots[hand]
+            if not visited[hand] or now > self._cache[key].expires_at:
+                break
+            # 已访问的条目获得第二次机会
+            visited[hand] = 0
+            hand = (hand + 1) % self.max_size
+
+        self._hand = (hand + 1) % self.max_size
+        self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        """删除条目并释放其槽位"""
+        del self._cache[key]
+
+        slot = self._key_slots.pop(key)
+        self._slots[slot] = None
+        self._visited[slot] = 0
+        self._free_slots.append(slot)
 
-        return count
+        self._unlink_tags(key)
 
-    async def _cleanup_expired(self) -> None:
-        """清理过期条目"""
-        expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
+    def _unlink_tags(self, key: str) -> None:
+        """删除键的标签映射"""
+        tags = self._key_tags.pop(key, None)
+        if not tags:
+            return
 
-        for key in expired_keys:
-            await self.delete(key)
+        for tag in tags:
+            keys = self._tag_mappings.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_mappings[tag]
 
     def get_stats(self) -> dict[str, Any]:
         """获取缓存统计"""
@@ -242,7 +353,7 @@ class RedisBackend(CacheBackend):
 
         try:
             redis_key = self._make_key(key)
-            data = pickle.dumps(value)
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
 
             # 设置缓存值
             await self._redis.setex(redis_key, ttl, data)
@@ -259,6 +370,47 @@ class RedisBackend(CacheBackend):
             logger.warning(f"Redis设置缓存失败: {e}")
             return False
 
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        """批量获取缓存值（单次MGET）"""
+        if not keys or not await self._ensure_connection():
+            return [None] * len(keys)
+
+        try:
+            values = await self._redis.mget([self._make_key(key) for key in keys])
+            return [pickle.loads(data) if data else None for data in values]
+        except Exception as e:
+            logger.warning(f"Redis批量获取缓存失败: {e}")
+            return [None] * len(keys)
+
+    async def set_many(
+        self, items: dict[str, Any], ttl: int = 300, tags: set[str] | None = None
+    ) -> bool:
+        """批量设置缓存值（单次管道往返）"""
+        if not items:
+            return True
+        if not await self._ensure_connection():
+            return False
+
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+                    pipe.setex(self._make_key(key), ttl, data)
+
+                # 设置标签映射
+                if tags:
+                    for tag in tags:
+                        tag_key = self._make_tag_key(tag)
+                        pipe.sadd(tag_key, *items)
+                        pipe.expire(tag_key, ttl)
+
+                await pipe.execute()
+
+            return True
+        except Exception as e:
+            logger.warning(f"Redis批量设置缓存失败: {e}")
+            return False
+
     async def delete(self, key: str) -> bool:
         """删除缓存值"""
         if not await self._ensure_connection():
@@ -42,6 +42,11 @@ def cache_query(
     """
 
     def decorator(func: F) -> F:
+        # 键前缀和标签在装饰时确定，调用时只需处理参数
+        prefix = key_prefix or func.__name__
+        key_head = f"{prefix}:{func.__qualname__}"
+        cache_tags = _normalize_tags(tags)
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             # 检查缓存条件
@@ -49,26 +54,22 @@ def cache_query(
                 return await func(*args, **kwargs)
 
             # 生成缓存键
-            prefix = key_prefix or func.__name__
-            cache_key = _generate_cache_key(
-                prefix=prefix, args=args, kwargs=kwargs, func_name=func.__qualname__
-            )
+            cache_key = _build_cache_key(key_head, prefix, args, kwargs)
 
             # 尝试从缓存获取
             cached_result = await cache.get(cache_key)
             if cached_result is not None:
-                logger.debug(f"缓存命中: {cache_key}")
+                logger.debug("缓存命中: %s", cache_key)
                 return _deserialize_if_needed(cached_result, serialize)
 
             # 执行原函数
             result = await func(*args, **kwargs)
 
             # 设置缓存
-            cache_tags = _normalize_tags(tags)
             serialized_result = _serialize_if_needed(result, serialize)
 
             await cache.set(cache_key, serialized_result, ttl, cache_tags)
-            logger.debug(f"缓存设置: {cache_key}")
+            logger.debug("缓存设置: %s", cache_key)
 
             return result
 
@@ -144,9 +145,11 @@ def cache_method(
     """
 
     def decorator(func: F) -> F:
+        base_tags = _normalize_tags(tags)
+
         @wraps(func)
         async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
-            # 生成缓存键
+            # 生成缓存键（类名随子类变化，只能在调用时确定）
             prefix = f"{self.__class__.__name__}.{func.__name__}"
 
             cache_params = {}
@@ -155,28 +158,25 @@ def cache_method(
             elif use_self:
                 cache_params["self"] = str(hash(self))
 
-            cache_key = _generate_cache_key(
-                prefix=prefix, args=args, kwargs=kwargs, extra_params=cache_params
-            )
+            cache_key = _build_cache_key(prefix, prefix, args, kwargs, cache_params)
 
             # 尝试从缓存获取
             cached_result = await cache.get(cache_key)
             if cached_result is not None:
-                logger.debug(f"方法缓存命中: {cache_key}")
+                logger.debug("方法缓存命中: %s", cache_key)
                 return cached_result
 
             # 执行原方法
             result = await func(self, *args, **kwargs)
 
             # 设置缓存
-            cache_tags = _normalize_tags(tags)
-            if include_class and cache_tags:
-                cache_tags.add(self.__class__.__name__.lower())
-            elif include_class:
-                cache_tags = {self.__class__.__name__.lower()}
+            cache_tags = base_tags
+            if include_class:
+                class_tag = self.__class__.__name__.lower()
+                cache_tags = base_tags | {class_tag} if base_tags else {class_tag}
 
             await cache.set(cache_key, result, ttl, cache_tags)
-            logger.debug(f"方法缓存设置: {cache_key}")
+            logger.debug("方法缓存设置: %s", cache_key)
 
             return result
 
@@ -204,28 +204,28 @@ def cache_property(
     """
 
     def decorator(func: F) -> F:
+        cache_tags = _normalize_tags(tags)
+
         @wraps(func)
         async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
             # 生成缓存键
-            cache_key = _generate_cache_key(
-                prefix=f"{self.__class__.__name__}.{func.__name__}",
-                args=(getattr(self, "id", str(hash(self))),),
-                kwargs=kwargs,
+            prefix = f"{self.__class__.__name__}.{func.__name__}"
+            cache_key = _build_cache_key(
+                prefix, prefix, (getattr(self, "id", str(hash(self))),), kwargs
             )
 
             # 尝试从缓存获取
             cached_result = await cache.get(cache_key)
             if cached_result is not None:
-                logger.debug(f"属性缓存命中: {cache_key}")
+                logger.debug("属性缓存命中: %s", cache_key)
                 return cached_result
 
             # 计算属性值
             result = await func(self, *args, **kwargs)
 
             # 设置缓存
-            cache_tags = _normalize_tags(tags)
             await cache.set(cache_key, result, ttl, cache_tags)
-            logger.debug(f"属性缓存设置: {cache_key}")
+            logger.debug("属性缓存设置: %s", cache_key)
 
             return result
 
@@ -258,6 +258,10 @@ def conditional_cache(
     """
 
     def decorator(func: F) -> F:
+        prefix = func.__name__
+        key_head = f"{prefix}:{func.__qualname__}"
+        cache_tags = _normalize_tags(tags)
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             # 检查是否应该使用缓存
@@ -265,23 +269,17 @@ def conditional_cache(
                 return await func(*args, **kwargs)
 
             # 使用普通缓存逻辑
-            cache_key = _generate_cache_key(
-                prefix=func.__name__,
-                args=args,
-                kwargs=kwargs,
-                func_name=func.__qualname__,
-            )
+            cache_key = _build_cache_key(key_head, prefix, args, kwargs)
 
             cached_result = await cache.get(cache_key)
             if cached_result is not None:
-                logger.debug(f"条件缓存命中: {cache_key}")
+                logger.debug("条件缓存命中: %s", cache_key)
                 return cached_result
 
             result = await func(*args, **kwargs)
 
-            cache_tags = _normalize_tags(tags)
             await cache.set(cache_key, result, ttl, cache_tags)
-            logger.debug(f"条件缓存设置: {cache_key}")
+            logger.debug("条件缓存设置: %s", cache_key)
 
             return result
 
@@ -293,18 +291,15 @@ def conditional_cache(
 # 辅助函数
 
 
-def _generate_cache_key(
+def _build_cache_key(
+    head: str,
     prefix: str,
     args: tuple = (),
     kwargs: dict | None = None,
-    func_name: str | None = None,
     extra_params: dict | None = None,
 ) -> str:
-    """生成缓存键"""
-    key_parts = [prefix]
-
-    if func_name:
-        key_parts.append(func_name)
+    """在预先拼好的键头部之后追加参数部分"""
+    key_parts = [head]
 
     # 处理位置参数
     if args:
@@ -325,7 +320,7 @@ def _generate_cache_key(
 
     # 如果键太长，使用哈希
     if len(key) > 250:
-        key_hash = hashlib.md5(key.encode()).hexdigest()
+        key_hash = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
         return f"{prefix}:hash:{key_hash}"
 
     return key
@@ -334,10 +329,10 @@ def _generate_cache_key(
 def _serialize_args(args: tuple) -> str:
     """序列化位置参数"""
     try:
-        return hashlib.md5(str(args).encode()).hexdigest()[:16]
+        return hashlib.blake2b(str(args).encode(), digest_size=8).hexdigest()
     except Exception:
         args_hash = str(hash(args))
-        return hashlib.md5(args_hash.encode()).hexdigest()[:16]
+        return hashlib.blake2b(args_hash.encode(), digest_size=8).hexdigest()
 
 
 def _serialize_kwargs(kwargs: dict) -> str:
@@ -345,10 +340,14 @@ def _serialize_kwargs(kwargs: dict) -> str:
     try:
         # 排序以确保一致性
         sorted_items = sorted(kwargs.items())
-        return hashlib.md5(str(sorted_items).encode()).hexdigest()[:16]
+        return hashlib.blake2b(
+            str(sorted_items).encode(), digest_size=8
+        ).hexdigest()
     except Exception:
         frozen_items = frozenset(kwargs.items())
-        return hashlib.md5(str(hash(frozen_items)).encode()).hexdigest()[:16]
+        return hashlib.blake2b(
+            str(hash(frozen_items)).encode(), digest_size=8
+        ).hexdigest()
 
 
 def _normalize_tags(tags: str | set[str] | None) -> set[str] | None:
@@ -4,6 +4,8 @@ FastORM 缓存管理器
 提供统一的缓存管理接口。
 """
 
+from __future__ import annotations
+
 import hashlib
 import logging
 from typing import Any, Optional
@@ -91,13 +93,15 @@ class CacheManager:
             parts.append(f"model:{model}")
 
         if query:
-            query_hash = hashlib.md5(query.encode()).hexdigest()[:8]
+            query_hash = hashlib.blake2b(query.encode(), digest_size=4).hexdigest()
             parts.append(f"query:{query_hash}")
 
         if params:
             # 将参数转换为确定性字符串
             param_str = str(sorted(params.items()))
-            param_hash = hashlib.md5(param_str.encode()).hexdigest()[:8]
+            param_hash = hashlib.blake2b(
+                param_str.encode(), digest_size=4
+            ).hexdigest()
             parts.append(f"params:{param_hash}")
 
         return ":".join(parts)
@@ -105,6 +109,9 @@ class CacheManager:
     async def get(self, key: str) -> Any | None:
         """获取缓存值"""
         backend = self.get_backend()
+        # 内存后端直接走同步路径（子类可能重写异步方法，因此按精确类型判断）
+        if type(backend) is MemoryBackend:
+            return backend.get_nowait(key)
         return await backend.get(key)
 
     async def set(
@@ -112,8 +119,22 @@ class CacheManager:
     ) -> bool:
         """设置缓存值"""
         backend = self.get_backend()
+        if type(backend) is MemoryBackend:
+            return backend.set_nowait(key, value, ttl, tags)
         return await backend.set(key, value, ttl, tags)
 
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        """批量获取缓存值，按keys顺序返回，未命中为None"""
+        backend = self.get_backend()
+        return await backend.get_many(keys)
+
+    async def set_many(
+        self, items: dict[str, Any], ttl: int = 300, tags: set[str] | None = None
+    ) -> bool:
+        """批量设置缓存值"""
+        backend = self.get_backend()
+        return await backend.set_many(items, ttl, tags)
+
     async def delete(self, key: str) -> bool:
         """删除缓存值"""
         backend = self.get_backend()
@@ -4,12 +4,31 @@ FastORM现有项目集成命令
 为现有的FastAPI项目添加FastORM支持，实现渐进式集成。
 """
 
+import os
 import re
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 import click
 
+# 扫描项目时跳过的目录（虚拟环境、缓存、构建产物等）
+_EXCLUDE_DIRS = frozenset(
+    {
+        "__pycache__",
+        ".git",
+        ".venv",
+        "venv",
+        "build",
+        "dist",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        "node_modules",
+    }
+)
+
 
 @click.command()
 @click.option(
@@ -152,12 +171,8 @@ def _find_fastapi_apps(project_root: Path) -> list[Path]:
             fastapi_files.append(file_path)
 
     # 递归搜索其他可能的FastAPI文件
-    for py_file in project_root.rglob("*.py"):
-        if (
-            py_file.name.startswith(".")
-            or "venv" in str(py_file)
-            or "__pycache__" in str(py_file)
-        ):
+    for py_file in _iter_python_files(project_root):
+        if py_file.name.startswith("."):
             continue
         if py_file not in fastapi_files and _is_fastapi_file(py_file):
             fastapi_files.append(py_file)
@@ -165,6 +180,26 @@ def _find_fastapi_apps(project_root: Path) -> list[Path]:
     return fastapi_files
 
 
+def _iter_python_files(root: Path) -> Iterator[Path]:
+    """遍历目录下的Python文件
+
+    在目录层级直接剪除 _EXCLUDE_DIRS 中的目录，避免进入虚拟环境、
+    缓存和构建目录做无用的 stat 与读取。
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _EXCLUDE_DIRS:
+                            stack.append(Path(entry.path))
+                    elif entry.name.endswith(".py"):
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
 def _is_fastapi_file(file_path: Path) -> bool:
     """检查文件是否为FastAPI应用"""
     try:
@@ -258,8 +293,7 @@ def _detect_database_config(project_root: Path) -> dict:
                 continue
 
     # 检查配置文件中的数据库URL
-    config_files = list(project_root.rglob("*.py"))
-    for config_file in config_files:
+    for config_file in _iter_python_files(project_root):
         if (
             "config" in config_file.name.lower()
             or "setting" in config_file.name.lower()
@@ -7,11 +7,11 @@ FastORM 配置系统
 import os
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class FastORMConfig:
     """FastORM 配置类"""
     
@@ -90,11 +90,38 @@ class FastORMConfig:
     auto_validation: bool = True
 
 
+# 视为真值的环境变量取值（小写）
+_TRUE_VALUES = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _parse_env_bool(value: str) -> bool:
+    """解析布尔型环境变量"""
+    return value.lower() in _TRUE_VALUES
+
+
+# 环境变量 -> (配置项, 转换函数)，模块加载时构建一次
+_ENV_MAPPINGS = (
+    ('FASTORM_TIMESTAMPS_ENABLED', 'timestamps_enabled', _parse_env_bool),
+    ('FASTORM_DATABASE_URL', 'database_url', str),
+    ('FASTORM_ECHO_SQL', 'echo_sql', _parse_env_bool),
+    ('FASTORM_DEBUG', 'debug', _parse_env_bool),
+    ('FASTORM_TESTING', 'testing', _parse_env_bool),
+    ('FASTORM_POOL_SIZE', 'pool_size', int),
+    ('FASTORM_MAX_OVERFLOW', 'max_overflow', int),
+    ('FASTORM_QUERY_CACHE_ENABLED', 'query_cache_enabled', _parse_env_bool),
+    ('FASTORM_BATCH_SIZE', 'batch_size', int),
+    ('FASTORM_AUTO_CREATE_TABLES', 'auto_create_tables', _parse_env_bool),
+    ('FASTORM_STRICT_VALIDATION', 'strict_validation', _parse_env_bool),
+)
+
+
 class ConfigManager:
     """配置管理器"""
     
+    __slots__ = ('_config',)
+
     _instance: Optional['ConfigManager'] = None
-    _config: FastORMConfig = field(default_factory=FastORMConfig)
+    _config: FastORMConfig
     
     def __new__(cls) -> 'ConfigManager':
         """单例模式"""
@@ -114,32 +141,12 @@ class ConfigManager:
     
     def _load_from_env(self) -> None:
         """从环境变量加载配置"""
-        env_mappings = {
-            'FASTORM_TIMESTAMPS_ENABLED': ('timestamps_enabled', bool),
-            'FASTORM_DATABASE_URL': ('database_url', str),
-            'FASTORM_ECHO_SQL': ('echo_sql', bool),
-            'FASTORM_DEBUG': ('debug', bool),
-            'FASTORM_TESTING': ('testing', bool),
-            'FASTORM_POOL_SIZE': ('pool_size', int),
-            'FASTORM_MAX_OVERFLOW': ('max_overflow', int),
-            'FASTORM_QUERY_CACHE_ENABLED': ('query_cache_enabled', bool),
-            'FASTORM_BATCH_SIZE': ('batch_size', int),
-            'FASTORM_AUTO_CREATE_TABLES': ('auto_create_tables', bool),
-            'FASTORM_STRICT_VALIDATION': ('strict_validation', bool),
-        }
-        
-        for env_key, (attr_name, attr_type) in env_mappings.items():
-            env_value = os.getenv(env_key)
+        environ = os.environ
+        for env_key, attr_name, convert in _ENV_MAPPINGS:
+            env_value = environ.get(env_key)
             if env_value is not None:
                 try:
-                    if attr_type == bool:
-                        value = env_value.lower() in ('true', '1', 'yes', 'on')
-                    elif attr_type == int:
-                        value = int(env_value)
-                    else:
-                        value = env_value
-                    
-                    setattr(self._config, attr_name, value)
+                    setattr(self._config, attr_name, convert(env_value))
                 except (ValueError, TypeError):
                     pass  # 忽略无效的环境变量值
     
@@ -293,26 +300,31 @@ def require_config(config_key: str, error_message: str = None):
 # 配置验证
 # =============================================================================
 
-def validate_config() -> Dict[str, str]:
-    """验证配置合法性"""
-    errors = {}
-    config = get_config()
-    
+# 支持的数据库URL前缀
+_SUPPORTED_DB_SCHEMES = ('sqlite', 'postgresql', 'mysql')
+
+# (配置项, 校验函数, 错误信息)
+_CONFIG_RULES = (
     # 验证数据库URL格式
-    if config.database_url:
-        if not any(config.database_url.startswith(scheme) 
-                  for scheme in ['sqlite', 'postgresql', 'mysql']):
-            errors['database_url'] = "不支持的数据库类型"
-    
+    (
+        'database_url',
+        lambda c: not c.database_url
+        or c.database_url.startswith(_SUPPORTED_DB_SCHEMES),
+        "不支持的数据库类型",
+    ),
     # 验证连接池配置
-    if config.pool_size <= 0:
-        errors['pool_size'] = "连接池大小必须大于0"
-    
-    if config.max_overflow < 0:
-        errors['max_overflow'] = "最大溢出连接数不能小于0"
-    
+    ('pool_size', lambda c: c.pool_size > 0, "连接池大小必须大于0"),
+    ('max_overflow', lambda c: c.max_overflow >= 0, "最大溢出连接数不能小于0"),
     # 验证批量大小
-    if config.batch_size <= 0:
-        errors['batch_size'] = "批量大小必须大于0"
-    
-    return errors 
\ No newline at end of file
+    ('batch_size', lambda c: c.batch_size > 0, "批量大小必须大于0"),
+)
+
+
+def validate_config() -> Dict[str, str]:
+    """验证配置合法性"""
+    config = get_config()
+    return {
+        name: message
+        for name, check, message in _CONFIG_RULES
+        if not check(config)
+    }
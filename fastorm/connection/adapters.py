@@ -10,10 +10,23 @@ from __future__ import annotations
 from abc import ABC
 from abc import abstractmethod
 from dataclasses import dataclass
+from importlib.util import find_spec
 from typing import Any
 from urllib.parse import urlparse
 
+from sqlalchemy import event
 from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.pool import StaticPool
+
+# SQLite 快速模式 PRAGMA：WAL日志、降低fsync频率、临时表放内存、64MB页缓存
+SQLITE_FAST_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -64000,
+}
 
 
 @dataclass
@@ -57,10 +70,11 @@ class OptimalConfig:
     pool_timeout: int = 30
     pool_recycle: int = 3600
     pool_pre_ping: bool = True
+    # 后进先出复用连接：总是取最近归还的热连接，空闲连接自然超时回收
+    pool_use_lifo: bool = True
     echo: bool = False
     # SQLAlchemy 2.0 新特性
     query_cache_size: int = 1200
-    compiled_cache_size: int = 1000
     # 数据库特定配置
     extra_engine_options: dict[str, Any] = None
 
@@ -127,12 +141,10 @@ class DatabaseAdapter(ABC):
 
     def detect_driver(self) -> str:
         """检测可用的驱动"""
+        # 仅解析模块规格，不执行驱动模块本身的导入
         for driver in [self.default_driver] + list(self.available_drivers):
-            try:
-                __import__(driver)
+            if find_spec(driver) is not None:
                 return driver
-            except ImportError:
-                continue
 
         raise ImportError(
             f"没有找到可用的{self.dialect_name}驱动。"
@@ -221,7 +233,6 @@ class PostgreSQLAdapter(DatabaseAdapter):
             pool_pre_ping=True,
             echo=False,
             query_cache_size=1200,
-            compiled_cache_size=1000,
             extra_engine_options={
                 # PostgreSQL特定优化
                 "server_side_cursors": True,
@@ -289,7 +300,6 @@ class MySQLAdapter(DatabaseAdapter):
             pool_pre_ping=True,
             echo=False,
             query_cache_size=1200,
-            compiled_cache_size=1000,
             extra_engine_options={
                 # MySQL特定优化
                 "charset": "utf8mb4",
@@ -321,6 +331,22 @@ class SQLiteAdapter(DatabaseAdapter):
     def available_drivers(self) -> set[str]:
         return {"aiosqlite"}
 
+    @property
+    def is_memory_database(self) -> bool:
+        """是否为内存数据库"""
+        path = self.parsed_url.path
+        return (
+            path in ("", "/")
+            # 包括 file::memory:?cache=shared 形式的URI
+            or path.endswith(":memory:")
+            or "mode=memory" in self.parsed_url.query
+        )
+
+    @property
+    def is_shared_memory_database(self) -> bool:
+        """是否为共享缓存的内存数据库（同一进程内的各连接看到同一个库）"""
+        return self.is_memory_database and "cache=shared" in self.parsed_url.query
+
     def _detect_features(self) -> DatabaseFeatures:
         """SQLite特性检测"""
         return DatabaseFeatures(
@@ -349,14 +375,13 @@ class SQLiteAdapter(DatabaseAdapter):
     def _build_optimal_config(self) -> OptimalConfig:
         """SQLite最优配置"""
         return OptimalConfig(
-            pool_size=1,  # SQLite是单文件数据库
-            max_overflow=0,
+            pool_size=5,  # 仅用于fast_mode（WAL），此时多个读连接可并发
+            max_overflow=10,  # 与SQLAlchemy默认一致，嵌套会话可临时借用连接
             pool_timeout=30,
             pool_recycle=-1,  # SQLite不需要回收连接
             pool_pre_ping=False,
             echo=False,
             query_cache_size=1200,
-            compiled_cache_size=1000,
             extra_engine_options={
                 # aiosqlite特定配置
                 "check_same_thread": False,
@@ -448,11 +473,14 @@ def detect_database_type(database_url: str | URL) -> str:
     return adapter.dialect_name
 
 
-def get_optimal_engine_config(database_url: str | URL) -> dict[str, Any]:
+def get_optimal_engine_config(
+    database_url: str | URL, fast_mode: bool = False
+) -> dict[str, Any]:
     """获取数据库的最优引擎配置
 
     Args:
         database_url: 数据库连接URL
+        fast_mode: 是否启用SQLite快速模式（WAL），影响文件型SQLite的连接池大小
 
     Returns:
         引擎配置字典
@@ -463,22 +491,47 @@ def get_optimal_engine_config(database_url: str | URL) -> dict[str, Any]:
     # 构建引擎配置
     engine_config = {
         "echo": config.echo,
+        # 按语句结构缓存编译后的SQL，参数值在执行时绑定；
+        # 只有字面量不同的链式查询共用同一份编译结果
+        "query_cache_size": config.query_cache_size,
     }
     
     # 只有非SQLite数据库才添加这些配置
     if adapter.dialect_name != "sqlite":
         engine_config.update({
-            # SQLAlchemy 2.0 新特性
-            "query_cache_size": config.query_cache_size,
-            "compiled_cache_size": config.compiled_cache_size,
             # 池配置
             "pool_size": config.pool_size,
             "max_overflow": config.max_overflow,
             "pool_timeout": config.pool_timeout,
             "pool_recycle": config.pool_recycle,
             "pool_pre_ping": config.pool_pre_ping,
+            "pool_use_lifo": config.pool_use_lifo,
         })
 
+    # 私有内存库每个连接都是独立的数据库，只能用StaticPool共用一个连接；
+    # 共享缓存的内存库各连接看到同一个库，使用普通连接池保持会话相互隔离，
+    # 常驻连接同时让内存库一直存在。
+    # 文件型SQLite默认的回滚日志模式下写操作会锁住整个库，常驻连接只保留一个，
+    # 嵌套会话通过溢出连接临时获取；fast_mode 开启WAL后读写互不阻塞，
+    # 才放大常驻连接数
+    if isinstance(adapter, SQLiteAdapter):
+        if adapter.is_shared_memory_database:
+            pool_size = config.pool_size
+        elif adapter.is_memory_database:
+            engine_config["poolclass"] = StaticPool
+            pool_size = None
+        else:
+            pool_size = config.pool_size if fast_mode else 1
+
+        if pool_size is not None:
+            engine_config.update({
+                "poolclass": AsyncAdaptedQueuePool,
+                "pool_size": pool_size,
+                "max_overflow": config.max_overflow,
+                "pool_timeout": config.pool_timeout,
+                "pool_use_lifo": config.pool_use_lifo,
+            })
+
     # 添加数据库特定配置（对SQLite也有效）
     if adapter.dialect_name == "sqlite":
         # SQLite只使用connect_args传递参数
@@ -489,6 +542,31 @@ def get_optimal_engine_config(database_url: str | URL) -> dict[str, Any]:
     return engine_config
 
 
+def install_sqlite_pragmas(
+    engine: AsyncEngine, pragmas: dict[str, str | int] | None = None
+) -> None:
+    """为SQLite引擎的每个新连接设置PRAGMA
+
+    Args:
+        engine: 异步引擎
+        pragmas: PRAGMA配置，默认使用 SQLITE_FAST_PRAGMAS
+    """
+    statements = [
+        f"PRAGMA {name}={value}"
+        for name, value in (pragmas or SQLITE_FAST_PRAGMAS).items()
+    ]
+
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    event.listen(engine.sync_engine, "connect", _on_connect)
+
+
 def validate_database_connection(database_url: str | URL) -> dict[str, str]:
     """验证数据库连接参数
 
@@ -515,5 +593,6 @@ __all__ = [
     "DatabaseAdapterFactory",
     "detect_database_type",
     "get_optimal_engine_config",
+    "install_sqlite_pragmas",
     "validate_database_connection",
 ]
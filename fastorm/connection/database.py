@@ -19,6 +19,7 @@ from sqlalchemy.ext.asyncio import create_async_engine
 
 from .adapters import DatabaseAdapterFactory
 from .adapters import get_optimal_engine_config
+from .adapters import install_sqlite_pragmas
 from .adapters import validate_database_connection
 
 logger = logging.getLogger("fastorm.database")
@@ -81,6 +82,7 @@ class Database:
         self,
         database_config: str | dict[str, str],
         read_write_config: ReadWriteConfig | None = None,
+        fast_mode: bool = False,
         **engine_kwargs: Any,
     ):
         """初始化数据库连接
@@ -88,6 +90,7 @@ class Database:
         Args:
             database_config: 数据库配置，可以是单个URL或读写分离的字典
             read_write_config: 读写分离配置
+            fast_mode: 为SQLite连接启用WAL等快速模式PRAGMA
             **engine_kwargs: 引擎配置参数
         """
         self._engines: dict[str, AsyncEngine] = {}
@@ -97,6 +100,7 @@ class Database:
         )
         self._is_read_write_mode: bool = False
         self._current_connection_type: ConnectionType | None = None
+        self._fast_mode: bool = fast_mode
         
         # 初始化连接
         self._initialize_connections(database_config, **engine_kwargs)
@@ -132,7 +136,7 @@ class Database:
             )
 
         # 获取最优配置
-        optimal_config = get_optimal_engine_config(database_url)
+        optimal_config = get_optimal_engine_config(database_url, self._fast_mode)
         # 用户配置优先于最优配置
         final_config = {**optimal_config, **engine_kwargs}
 
@@ -141,6 +145,7 @@ class Database:
         final_url = adapter.build_connection_url()
 
         engine = create_async_engine(final_url, **final_config)
+        self._prepare_engine(engine, adapter.dialect_name)
         self._engines["default"] = engine
         self._session_factories["default"] = async_sessionmaker(
             bind=engine, expire_on_commit=False
@@ -151,6 +156,11 @@ class Database:
             f"{adapter.dialect_name}"
         )
 
+    def _prepare_engine(self, engine: AsyncEngine, dialect_name: str) -> None:
+        """引擎创建后的附加配置"""
+        if self._fast_mode and dialect_name == "sqlite":
+            install_sqlite_pragmas(engine)
+
     def _init_read_write_databases(
         self, database_urls: dict[str, str], **engine_kwargs: Any
     ) -> None:
@@ -165,13 +175,14 @@ class Database:
         # 创建写库连接
         write_url = database_urls["write"]
         write_adapter = DatabaseAdapterFactory.create_adapter(write_url)
-        write_config = get_optimal_engine_config(write_url)
+        write_config = get_optimal_engine_config(write_url, self._fast_mode)
         write_final_config = {**write_config, **engine_kwargs}
         write_final_url = write_adapter.build_connection_url()
 
         write_engine = create_async_engine(
             write_final_url, **write_final_config
         )
+        self._prepare_engine(write_engine, write_adapter.dialect_name)
         self._engines["write"] = write_engine
         self._session_factories["write"] = async_sessionmaker(
             bind=write_engine, expire_on_commit=False
@@ -181,13 +192,14 @@ class Database:
         if "read" in database_urls:
             read_url = database_urls["read"]
             read_adapter = DatabaseAdapterFactory.create_adapter(read_url)
-            read_config = get_optimal_engine_config(read_url)
+            read_config = get_optimal_engine_config(read_url, self._fast_mode)
             read_final_config = {**read_config, **engine_kwargs}
             read_final_url = read_adapter.build_connection_url()
 
             read_engine = create_async_engine(
                 read_final_url, **read_final_config
             )
+            self._prepare_engine(read_engine, read_adapter.dialect_name)
             self._engines["read"] = read_engine
             self._session_factories["read"] = async_sessionmaker(
                 bind=read_engine, expire_on_commit=False
@@ -394,6 +406,7 @@ _default_database: Database | None = None
 def init(
     database_config: str | dict[str, str],
     read_write_config: ReadWriteConfig | None = None,
+    fast_mode: bool = False,
     **engine_kwargs: Any,
 ) -> Database:
     """初始化默认数据库连接
@@ -403,6 +416,7 @@ def init(
     Args:
         database_config: 数据库配置，可以是单个URL或读写分离的字典
         read_write_config: 读写分离配置
+        fast_mode: 为SQLite连接启用WAL等快速模式PRAGMA
         **engine_kwargs: 引擎配置参数
         
     Returns:
@@ -419,7 +433,9 @@ def init(
         })
     """
     global _default_database
-    _default_database = Database(database_config, read_write_config, **engine_kwargs)
+    _default_database = Database(
+        database_config, read_write_config, fast_mode=fast_mode, **engine_kwargs
+    )
     logger.info("Default database initialized")
     return _default_database
 
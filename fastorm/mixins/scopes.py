@@ -159,24 +159,22 @@ class ScopeMixin:
         """子类初始化时自动注册作用域"""
         super().__init_subclass__(**kwargs)
 
-        # 扫描并注册作用域方法
-        for attr_name in dir(cls):
-            if attr_name.startswith("_"):
-                continue
-
-            attr = getattr(cls, attr_name)
-            if not callable(attr):
-                continue
-
-            # 注册普通作用域
-            if hasattr(attr, "_is_scope") and attr._is_scope:
-                _scope_registry.register_scope(cls, attr._scope_name, attr)
-
-            # 注册全局作用域
-            if hasattr(attr, "_is_global_scope") and attr._is_global_scope:
-                _scope_registry.register_global_scope(
-                    cls, attr._global_scope_name, attr
-                )
+        # 只扫描类字典中定义的属性，按MRO从基类到子类覆盖。
+        # 避免 dir()+getattr 触发SQLAlchemy描述符，也不必遍历所有继承属性
+        for klass in reversed(cls.__mro__):
+            for attr_name, attr in vars(klass).items():
+                if attr_name.startswith("_") or not callable(attr):
+                    continue
+
+                # 注册普通作用域
+                if getattr(attr, "_is_scope", False):
+                    _scope_registry.register_scope(cls, attr._scope_name, attr)
+
+                # 注册全局作用域
+                if getattr(attr, "_is_global_scope", False):
+                    _scope_registry.register_global_scope(
+                        cls, attr._global_scope_name, attr
+                    )
 
     @classmethod
     def get_registered_scopes(cls) -> dict[str, Callable]:
@@ -203,6 +201,14 @@ class ScopedQueryBuilder:
         # 自动应用全局作用域
         self._apply_global_scopes()
 
+    def _wrap(self, query_builder: QueryBuilder) -> ScopedQueryBuilder:
+        """包装链式调用结果，沿用已应用的全局作用域而不重复应用"""
+        new_scoped = object.__new__(ScopedQueryBuilder)
+        new_scoped._query_builder = query_builder
+        new_scoped._model_class = self._model_class
+        new_scoped._applied_global_scopes = self._applied_global_scopes.copy()
+        return new_scoped
+
     def _apply_global_scopes(self) -> None:
         """自动应用全局作用域"""
         global_scopes = _scope_registry.get_global_scopes(self._model_class)
@@ -297,9 +303,7 @@ class ScopedQueryBuilder:
                 )
 
                 # 返回新的作用域查询构建器
-                new_scoped = ScopedQueryBuilder(result_builder, self._model_class)
-                new_scoped._applied_global_scopes = self._applied_global_scopes.copy()
-                return new_scoped
+                return self._wrap(result_builder)
 
             return scope_caller
 
@@ -313,11 +317,7 @@ class ScopedQueryBuilder:
 
                 # 如果返回的是QueryBuilder，包装为ScopedQueryBuilder
                 if hasattr(result, "_model_class"):
-                    new_scoped = ScopedQueryBuilder(result, self._model_class)
-                    new_scoped._applied_global_scopes = (
-                        self._applied_global_scopes.copy()
-                    )
-                    return new_scoped
+                    return self._wrap(result)
 
                 # 否则直接返回结果（如get(), first()等的执行结果）
                 return result
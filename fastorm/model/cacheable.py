@@ -25,6 +25,18 @@ class CacheableModel:
     _cache_tags: set[str] | None = None
     _cache_prefix: str | None = None
 
+    # 缓存键头部，定义子类时按前缀和模型名预先拼好
+    _id_key_prefix: str = "fastorm:model:cacheablemodel:"
+    _query_key_prefix: str = "fastorm:query:cacheablemodel:"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        model_name = cls.__name__.lower()
+        prefix = cls._cache_prefix or "fastorm"
+        cls._id_key_prefix = f"{prefix}:model:{model_name}:"
+        cls._query_key_prefix = f"{prefix}:query:{model_name}:"
+
     @classmethod
     def cache_for(cls, ttl: int) -> "ModelQueryBuilder":
         """设置缓存时间
@@ -115,9 +127,7 @@ class CacheableModel:
         Returns:
             缓存键
         """
-        model_name = cls.__name__.lower()
-        prefix = cls._cache_prefix or "fastorm"
-        return f"{prefix}:model:{model_name}:{id}"
+        return f"{cls._id_key_prefix}{id}"
 
     @classmethod
     async def cache_key_for_query(cls, **conditions) -> str:
@@ -132,14 +142,13 @@ class CacheableModel:
         import hashlib
         import json
 
-        model_name = cls.__name__.lower()
-        prefix = cls._cache_prefix or "fastorm"
-
         # 生成条件哈希
         conditions_str = json.dumps(conditions, sort_keys=True, default=str)
-        conditions_hash = hashlib.md5(conditions_str.encode()).hexdigest()[:8]
+        conditions_hash = hashlib.blake2b(
+            conditions_str.encode(), digest_size=4
+        ).hexdigest()
 
-        return f"{prefix}:query:{model_name}:{conditions_hash}"
+        return f"{cls._query_key_prefix}{conditions_hash}"
 
     async def cache_instance(self, ttl: int | None = None) -> None:
         """缓存当前模型实例
@@ -7,12 +7,14 @@ FastORM 模型
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from sqlalchemy import Integer, DateTime
 from sqlalchemy import MetaData
 from sqlalchemy import delete
 from sqlalchemy import func
+from sqlalchemy import insert
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase as SQLAlchemyDeclarativeBase
@@ -26,9 +28,12 @@ from fastorm.mixins.pydantic_integration import PydanticIntegrationMixin
 from fastorm.mixins.scopes import ScopeMixin
 from fastorm.mixins.scopes import create_scoped_query
 from fastorm.mixins.soft_delete import SoftDeleteMixin
+from fastorm.query.builder import QueryBuilder
+from fastorm.query.soft_delete import SoftDeleteQueryBuilder
 
 if TYPE_CHECKING:
-    from fastorm.query.builder import QueryBuilder
+    from collections.abc import AsyncIterator
+    from collections.abc import Callable
 
 T = TypeVar("T", bound="Model")
 
@@ -360,6 +365,24 @@ class Model(
         # 使用作用域查询构建器以确保应用全局作用域
         return await cls.query().get()
 
+    @classmethod
+    def stream(cls: type[T], chunk_size: int = 1000) -> AsyncIterator[T]:
+        """逐条迭代所有记录 - 使用读库，自动应用软删除过滤和全局作用域
+
+        与 all() 不同，结果按批次从游标读取，内存占用与表大小无关。
+
+        Args:
+            chunk_size: 每批从游标读取的记录数
+
+        Returns:
+            模型实例的异步迭代器
+
+        Example:
+            async for user in User.stream(chunk_size=1000):
+                print(user.name)
+        """
+        return cls.query().stream(chunk_size)
+
     @classmethod
     async def count(cls: type[T]) -> int:
         """统计记录数量 - 无需session参数！使用读库
@@ -446,15 +469,54 @@ class Model(
         """
 
         async def _create_many(session: AsyncSession) -> list[T]:
+            if not records:
+                return []
+
+            dialect = session.get_bind().dialect
+            if dialect.insert_executemany_returning_sort_by_parameter_order:
+                # 单条多行 INSERT ... RETURNING，直接得到按输入顺序排列的实例
+                stmt = insert(cls).returning(cls, sort_by_parameter_order=True)
+                result = await session.scalars(stmt, records)
+                return list(result.all())
+
+            # 不支持批量 RETURNING 的数据库：flush 后主键和默认值已回填
             instances = [cls(**record) for record in records]
             session.add_all(instances)
             await session.flush()
-            for instance in instances:
-                await session.refresh(instance)
             return instances
 
         return await execute_with_session(_create_many)
 
+    @classmethod
+    async def bulk_create(cls: type[T], records: list[dict[str, Any]]) -> int:
+        """批量插入记录，不构造模型实例
+
+        与 create_many 不同，不回填主键、不返回实例，以单条INSERT语句加多组
+        参数（executemany）执行，适合只需写入数据的场景。
+
+        Args:
+            records: 记录数据列表
+
+        Returns:
+            插入的记录数量
+
+        Example:
+            count = await User.bulk_create([
+                {'name': 'John', 'email': 'john@example.com'},
+                {'name': 'Jane', 'email': 'jane@example.com'}
+            ])
+        """
+
+        async def _bulk_create(session: AsyncSession) -> int:
+            if not records:
+                return 0
+
+            await session.execute(insert(cls), records)
+            # executemany 的 rowcount 并非所有驱动都可靠，直接返回记录数
+            return len(records)
+
+        return await execute_with_session(_bulk_create)
+
     @classmethod
     async def delete_where(cls: type[T], column: str, value: Any) -> int:
         """删除符合条件的记录
@@ -634,10 +696,8 @@ class Model(
 
         # 如果启用软删除，使用SoftDeleteQueryBuilder
         if getattr(cls, 'soft_delete', False):
-            from fastorm.query.soft_delete import SoftDeleteQueryBuilder
             return SoftDeleteQueryBuilder(cls).where(column, actual_operator, actual_value)
         else:
-            from fastorm.query.builder import QueryBuilder
             return QueryBuilder(cls).where(column, actual_operator, actual_value)
 
     @classmethod
@@ -652,10 +712,8 @@ class Model(
         """
         if not getattr(cls, 'soft_delete', False):
             # 如果模型未启用软删除，返回普通查询构建器
-            from fastorm.query.builder import QueryBuilder
             return QueryBuilder(cls)
         
-        from fastorm.query.soft_delete import SoftDeleteQueryBuilder
         return SoftDeleteQueryBuilder(cls, include_deleted=True)
 
     @classmethod
@@ -671,7 +729,6 @@ class Model(
         if not getattr(cls, 'soft_delete', False):
             raise ValueError(f"模型 {cls.__name__} 未启用软删除功能")
         
-        from fastorm.query.soft_delete import SoftDeleteQueryBuilder
         return SoftDeleteQueryBuilder(cls, only_deleted=True)
 
     @classmethod
@@ -686,10 +743,8 @@ class Model(
         """
         if not getattr(cls, 'soft_delete', False):
             # 如果模型未启用软删除，返回普通查询构建器
-            from fastorm.query.builder import QueryBuilder
             return QueryBuilder(cls)
         
-        from fastorm.query.soft_delete import SoftDeleteQueryBuilder
         return SoftDeleteQueryBuilder(cls, include_deleted=False)
 
     @classmethod
@@ -711,6 +766,26 @@ class Model(
         """
         return create_scoped_query(cls)
 
+    @classmethod
+    def _get_serialize_columns(cls) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+        """获取序列化用的 (列名, 取值函数) 元组，按模型类缓存
+
+        Returns:
+            列名与属性取值函数组成的元组
+        """
+        columns = cls.__dict__.get("_serialize_columns")
+        if columns is None:
+            table = getattr(cls, "__table__", None)
+            if table is None:
+                return ()
+            mapper = cls.__mapper__
+            columns = tuple(
+                (column.name, attrgetter(mapper.get_property_by_column(column).key))
+                for column in table.columns
+            )
+            cls._serialize_columns = columns
+        return columns
+
     def to_dict(self, exclude: list[str] | None = None) -> dict[str, Any]:
         """转换为字典
 
@@ -720,16 +795,15 @@ class Model(
         Returns:
             字典表示
         """
-        exclude = exclude or []
+        exclude = frozenset(exclude) if exclude else frozenset()
         result = {}
 
-        if hasattr(self, "__table__"):
-            for column in self.__table__.columns:
-                if column.name not in exclude:
-                    value = getattr(self, column.name)
-                    # 处理日期时间类型
-                    if hasattr(value, "isoformat"):
-                        value = value.isoformat()
-                    result[column.name] = value
+        for name, getter in self._get_serialize_columns():
+            if name not in exclude:
+                value = getter(self)
+                # 处理日期时间类型
+                if hasattr(value, "isoformat"):
+                    value = value.isoformat()
+                result[name] = value
 
         return result
@@ -11,9 +11,38 @@ from dataclasses import dataclass
 from dataclasses import field
 from datetime import datetime
 from datetime import timedelta
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# 预编译的SQL标准化正则，每条SQL只需线性扫描一次
+_COMMENT_RE = re.compile(r"/\*.*?\*/|--[^\n]*", re.DOTALL)
+# 数字、字符串、命名参数合并为一个交替模式，一次替换为占位符
+_LITERAL_RE = re.compile(r"\b\d+\b|'[^']*'|%\([^)]+\)s")
+_TABLE_RE = re.compile(
+    r'\bFROM\s+([`"]?)(\w+)\1|\bUPDATE\s+([`"]?)(\w+)\3|\bINTO\s+([`"]?)(\w+)\5'
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_sql(sql: str) -> tuple[str, str]:
+    """标准化SQL语句（按原始SQL缓存，参数化语句重复出现时直接命中）"""
+    # 移除注释和多余空格
+    sql = " ".join(_COMMENT_RE.sub("", sql).split())
+
+    # 替换参数为占位符
+    sql_template = _LITERAL_RE.sub("?", sql)
+
+    # 提取表名：取第一个非空的表名匹配组
+    table_name = "unknown"
+    table_match = _TABLE_RE.search(sql.upper())
+    if table_match:
+        table_name = next(
+            name.lower() for name in table_match.groups()[1::2] if name
+        )
+
+    return sql_template.upper(), table_name
+
 
 @dataclass
 class QueryPattern:
@@ -67,32 +96,7 @@ class N1Detector:
         Returns:
             (sql_template, table_name)
         """
-        # 移除注释和多余空格
-        sql = re.sub(r"/\*.*?\*/", "", sql, flags=re.DOTALL)
-        sql = re.sub(r"--.*", "", sql)
-        sql = " ".join(sql.split())
-
-        # 替换参数为占位符
-        # 处理不同类型的参数
-        sql_template = re.sub(r"\b\d+\b", "?", sql)  # 数字
-        sql_template = re.sub(r"'[^']*'", "?", sql_template)  # 字符串
-        sql_template = re.sub(r"%\([^)]+\)s", "?", sql_template)  # 命名参数
-        sql_template = re.sub(r"\?", "?", sql_template)  # 其他占位符
-
-        # 提取表名
-        table_match = re.search(
-            r'\bFROM\s+([`"]?)(\w+)\1|\bUPDATE\s+([`"]?)(\w+)\3|\bINTO\s+([`"]?)(\w+)\5',
-            sql.upper(),
-        )
-        table_name = "unknown"
-        if table_match:
-            # 获取第一个非空的表名匹配组
-            for i in range(2, len(table_match.groups()) + 1, 2):
-                if table_match.group(i):
-                    table_name = table_match.group(i).lower()
-                    break
-
-        return sql_template.upper(), table_name
+        return _normalize_sql(sql)
 
     def analyze_query(self, sql: str, execution_time: datetime | None = None) -> None:
         """分析查询是否为N+1模式"""
@@ -4,16 +4,19 @@
 提供查询执行时间统计、SQL语句分析、内存使用监控等功能
 """
 
+import contextvars
 import logging
 import threading
 import time
 from collections.abc import AsyncIterator
 from collections.abc import Iterator
+from collections.abc import Mapping
 from contextlib import asynccontextmanager
 from contextlib import contextmanager
 from dataclasses import dataclass
 from dataclasses import field
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
 # SQLAlchemy imports
@@ -22,6 +25,13 @@ from sqlalchemy.engine import Engine
 
 logger = logging.getLogger(__name__)
 
+# 各分析器在当前任务/线程上下文中正在进行的会话ID
+# 只在进入/退出分析时整体替换为新映射，从不原地修改
+_active_sessions: contextvars.ContextVar[Mapping["QueryProfiler", str]] = (
+    contextvars.ContextVar("fastorm_profiler_sessions")
+)
+_NO_SESSIONS: Mapping["QueryProfiler", str] = MappingProxyType({})
+
 
 @dataclass
 class QueryInfo:
@@ -98,7 +108,6 @@ class QueryProfiler:
     def __init__(self, enable_stack_trace: bool = False):
         self.enable_stack_trace = enable_stack_trace
         self.sessions: dict[str, ProfileSession] = {}
-        self._current_session: str | None = None
         self._lock = threading.Lock()
         self._enabled = True
 
@@ -112,7 +121,10 @@ class QueryProfiler:
         def before_cursor_execute(
             conn, cursor, statement, parameters, context, executemany
         ):
-            if not self._enabled or not self._current_session:
+            if not self._enabled:
+                return
+            current_session = _active_sessions.get(_NO_SESSIONS).get(self)
+            if not current_session:
                 return
 
             # 记录查询开始信息
@@ -120,7 +132,7 @@ class QueryProfiler:
                 sql=statement,
                 params=parameters if not executemany else {},
                 start_time=datetime.now(),
-                session_id=self._current_session,
+                session_id=current_session,
             )
 
             # 添加堆栈跟踪
@@ -136,7 +148,7 @@ class QueryProfiler:
         def after_cursor_execute(
             conn, cursor, statement, parameters, context, executemany
         ):
-            if not self._enabled or not self._current_session:
+            if not self._enabled:
                 return
 
             # 获取查询信息并完成记录
@@ -144,15 +156,15 @@ class QueryProfiler:
             if query_info:
                 query_info.finish()
 
-                # 添加到当前会话
+                # 添加到查询开始时所属的会话
                 with self._lock:
-                    session = self.sessions.get(self._current_session)
+                    session = self.sessions.get(query_info.session_id)
                     if session:
                         session.add_query(query_info)
 
         @event.listens_for(Engine, "handle_error")
         def handle_error(exception_context):
-            if not self._enabled or not self._current_session:
+            if not self._enabled:
                 return
 
             # 记录查询错误
@@ -163,9 +175,9 @@ class QueryProfiler:
                 error_msg = str(exception_context.original_exception)
                 query_info.finish(error=error_msg)
 
-                # 添加到当前会话
+                # 添加到查询开始时所属的会话
                 with self._lock:
-                    session = self.sessions.get(self._current_session)
+                    session = self.sessions.get(query_info.session_id)
                     if session:
                         session.add_query(query_info)
 
@@ -180,14 +192,12 @@ class QueryProfiler:
 
         with self._lock:
             self.sessions[session_id] = session
-            old_session = self._current_session
-            self._current_session = session_id
+        token = self._activate(session_id)
 
         try:
             yield session
         finally:
-            with self._lock:
-                self._current_session = old_session
+            _active_sessions.reset(token)
 
     @asynccontextmanager
     async def async_profile(
@@ -202,14 +212,25 @@ class QueryProfiler:
 
         with self._lock:
             self.sessions[session_id] = session
-            old_session = self._current_session
-            self._current_session = session_id
+        token = self._activate(session_id)
 
         try:
             yield session
         finally:
-            with self._lock:
-                self._current_session = old_session
+            _active_sessions.reset(token)
+
+    def _activate(self, session_id: str) -> contextvars.Token:
+        """在当前上下文中登记本分析器的会话
+
+        当前分析会话按任务/线程上下文隔离，并发的分析会话互不干扰。
+        """
+        sessions = _active_sessions.get(_NO_SESSIONS)
+        return _active_sessions.set({**sessions, self: session_id})
+
+    @property
+    def current_session_id(self) -> str | None:
+        """当前上下文中正在进行的分析会话ID"""
+        return _active_sessions.get(_NO_SESSIONS).get(self)
 
     def get_session(self, session_id: str) -> ProfileSession | None:
         """获取分析会话"""
@@ -18,12 +18,14 @@ from .batch import BatchUpsert
 from .batch import BatchValidationError
 from .builder import QueryBuilder
 from .cache import QueryCacheSupport
+from .compiled import CompiledQuery
 from .pagination import Paginator
 from .soft_delete import SoftDeleteQueryBuilder
 
 __all__ = [
     # 查询构建器
     "QueryBuilder",
+    "CompiledQuery",
     # 分页
     "Paginator",
     # 缓存
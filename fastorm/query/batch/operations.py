@@ -8,8 +8,10 @@ from abc import ABC
 from abc import abstractmethod
 from typing import Any
 
+from sqlalchemy import and_
 from sqlalchemy import delete
 from sqlalchemy import insert
+from sqlalchemy import or_
 from sqlalchemy import update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
@@ -71,14 +73,31 @@ class BatchDelete(BatchOperation):
     async def execute(
         self, session, conditions: list[dict[str, Any]]
     ) -> dict[str, Any]:
-        """执行批量删除"""
-        deleted_count = 0
-        for condition in conditions:
-            stmt = delete(self.model_class.__table__).where(**condition)
-            result = await session.execute(stmt)
-            deleted_count += result.rowcount
+        """执行批量删除
+
+        所有条件合并为一条 DELETE 语句：条件都只涉及同一个字段时生成
+        ``WHERE field IN (...)``，否则生成 ``WHERE (...) OR (...)``。
+        """
+        if not conditions:
+            return {"deleted_count": 0}
+
+        table = self.model_class.__table__
+        field_sets = {tuple(condition) for condition in conditions}
+        if len(field_sets) == 1 and len(next(iter(field_sets))) == 1:
+            ((field,),) = field_sets
+            where_clause = table.c[field].in_(
+                [condition[field] for condition in conditions]
+            )
+        else:
+            where_clause = or_(
+                *(
+                    and_(*(table.c[key] == value for key, value in condition.items()))
+                    for condition in conditions
+                )
+            )
 
-        return {"deleted_count": deleted_count}
+        result = await session.execute(delete(table).where(where_clause))
+        return {"deleted_count": result.rowcount}
 
 
 class BatchUpsert(BatchOperation):
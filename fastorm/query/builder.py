@@ -6,7 +6,15 @@ FastORM 查询构建器
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from collections.abc import Callable
+from contextlib import nullcontext
+from operator import eq
+from operator import ge
+from operator import gt
+from operator import le
+from operator import lt
+from operator import ne
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -19,11 +27,18 @@ from sqlalchemy import asc
 from sqlalchemy import delete
 from sqlalchemy import desc
 from sqlalchemy import func
+from sqlalchemy import literal
 from sqlalchemy import select
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from fastorm.core.session_manager import SessionManager
 from fastorm.core.session_manager import execute_with_session
+from fastorm.query.compiled import CompiledQuery
+from fastorm.query.pagination import create_paginator
+from fastorm.query.pagination import create_simple_paginator
+from fastorm.relations.base import Relation
+from fastorm.relations.loader import RelationLoader
 
 T = TypeVar("T")
 
@@ -35,6 +50,22 @@ if TYPE_CHECKING:
     from fastorm.query.pagination import SimplePaginator
 
 
+# where() 支持的操作符（小写）-> 条件构造函数
+_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "=": eq,
+    ">": gt,
+    "<": lt,
+    ">=": ge,
+    "<=": le,
+    "!=": ne,
+    "<>": ne,
+    "like": lambda field, value: field.like(value),
+    "in": lambda field, value: field.in_(value),
+    "is": lambda field, value: field.is_(value),
+    "is not": lambda field, value: field.is_not(value),
+}
+
+
 class QueryBuilder(Generic[T]):
     """查询构建器
     
@@ -57,17 +88,32 @@ class QueryBuilder(Generic[T]):
     ```
     """
 
+    # 链式调用每一步都会克隆构建器，使用 __slots__ 避免为每个实例分配 __dict__
+    __slots__ = (
+        "_conditions",
+        "_distinct_value",
+        "_force_write",
+        "_limit_value",
+        "_model_class",
+        "_offset_value",
+        "_operation_type",
+        "_order_clauses",
+        "_query",
+        "_with_relations",
+    )
+
     def __init__(self, model_class: type[T]):
         self._model_class = model_class
-        self._conditions: list[Any] = []
-        self._order_clauses: list[Any] = []
+        # 条件和排序为不可变元组，克隆时新旧构建器直接共享
+        self._conditions: tuple[Any, ...] = ()
+        self._order_clauses: tuple[Any, ...] = ()
         self._limit_value: int | None = None
         self._offset_value: int | None = None
         self._distinct_value: bool = False
         self._with_relations: dict[str, Any] = {}
         self._query: Select = select(model_class)
         self._force_write: bool = False  # 强制使用写库标志
-        self._operation_type: str = "read"  # 操作类型：read/write/transaction
+        self._operation_type: str = "read"  # 操作类型即会话类型：read/write/transaction
 
     def force_write(self) -> QueryBuilder[T]:
         """强制使用写库（主库）
@@ -115,38 +161,15 @@ class QueryBuilder(Generic[T]):
         new_builder = self._clone()
 
         # 获取字段属性
-        if hasattr(self._model_class, column):
-            field = getattr(self._model_class, column)
-        else:
-            raise ValueError(
-                f"Field {column} not found in {self._model_class.__name__}"
-            )
+        field = self._get_field(column)
 
-        # 构建条件
-        if operator == "=":
-            condition = field == value
-        elif operator == ">":
-            condition = field > value
-        elif operator == "<":
-            condition = field < value
-        elif operator == ">=":
-            condition = field >= value
-        elif operator == "<=":
-            condition = field <= value
-        elif operator == "!=" or operator == "<>":
-            condition = field != value
-        elif operator.lower() == "like":
-            condition = field.like(value)
-        elif operator.lower() == "in":
-            condition = field.in_(value)
-        elif operator.lower() == "is":
-            condition = field.is_(value)
-        elif operator.lower() == "is not":
-            condition = field.is_not(value)
-        else:
+        # 构建条件：查表分派，不逐个比较操作符
+        build = _OPERATORS.get(operator.lower()) if isinstance(operator, str) else None
+        if build is None:
             raise ValueError(f"Unsupported operator: {operator}")
+        condition = build(field, value)
 
-        new_builder._conditions.append(condition)
+        new_builder._conditions += (condition,)
         return new_builder
 
     def order_by(self, column: str, direction: str = "asc") -> QueryBuilder[T]:
@@ -165,19 +188,27 @@ class QueryBuilder(Generic[T]):
         """
         new_builder = self._clone()
 
-        if hasattr(self._model_class, column):
-            field = getattr(self._model_class, column)
-            if direction.lower() == "desc":
-                new_builder._order_clauses.append(desc(field))
-            else:
-                new_builder._order_clauses.append(asc(field))
+        field = self._get_field(column)
+        if direction.lower() == "desc":
+            new_builder._order_clauses += (desc(field),)
         else:
-            raise ValueError(
-                f"Field {column} not found in {self._model_class.__name__}"
-            )
+            new_builder._order_clauses += (asc(field),)
 
         return new_builder
 
+    def _get_field(self, column: str) -> Any:
+        """获取模型字段属性
+
+        Raises:
+            ValueError: 模型上不存在该字段
+        """
+        try:
+            return getattr(self._model_class, column)
+        except AttributeError:
+            raise ValueError(
+                f"Field {column} not found in {self._model_class.__name__}"
+            ) from None
+
     def limit(self, count: int) -> QueryBuilder[T]:
         """设置查询限制
 
@@ -224,8 +255,10 @@ class QueryBuilder(Generic[T]):
             新的查询构建器实例
         """
         new_builder = self._clone()
-        for relation in relations:
-            new_builder._with_relations[relation] = True
+        new_builder._with_relations = {
+            **self._with_relations,
+            **dict.fromkeys(relations, True),
+        }
         return new_builder
 
     def _clone(self) -> QueryBuilder[T]:
@@ -234,13 +267,17 @@ class QueryBuilder(Generic[T]):
         Returns:
             新的查询构建器实例
         """
-        new_builder = QueryBuilder(self._model_class)
-        new_builder._conditions = self._conditions.copy()
-        new_builder._order_clauses = self._order_clauses.copy()
+        # 跳过 __init__：不必为每一步链式调用重新构造 select()
+        new_builder = QueryBuilder.__new__(QueryBuilder)
+        new_builder._model_class = self._model_class
+        # 元组和关系字典都不会被原地修改，直接共享引用
+        new_builder._conditions = self._conditions
+        new_builder._order_clauses = self._order_clauses
         new_builder._limit_value = self._limit_value
         new_builder._offset_value = self._offset_value
         new_builder._distinct_value = self._distinct_value
-        new_builder._with_relations = self._with_relations.copy()
+        new_builder._with_relations = self._with_relations
+        new_builder._query = self._query
         new_builder._force_write = self._force_write
         new_builder._operation_type = self._operation_type
         return new_builder
@@ -280,12 +317,21 @@ class QueryBuilder(Generic[T]):
         Returns:
             会话类型：read/write/transaction
         """
-        if self._force_write or self._operation_type == "write":
-            return "write"
-        elif self._operation_type == "transaction":
-            return "transaction"
-        else:
-            return "read"
+        # force_write() 在链式构建时已把操作类型切换为write，执行时直接读取
+        return self._operation_type
+
+    def compile(self) -> CompiledQuery[T]:
+        """预编译当前查询，供循环中重复执行
+
+        Returns:
+            可重复执行的预编译查询
+
+        Example:
+            stmt = User.where('age', '>', 20).limit(5).compile()
+            for _ in range(10):
+                users = await stmt.get()
+        """
+        return CompiledQuery(self)
 
     async def get(self) -> list[T]:
         """执行查询并获取所有结果 - 自动使用读库
@@ -312,6 +358,41 @@ class QueryBuilder(Generic[T]):
         session_type = self._get_session_type()
         return await execute_with_session(_get, connection_type=session_type)
 
+    async def stream(self, chunk_size: int = 1000) -> AsyncIterator[T]:
+        """以游标方式逐条迭代查询结果 - 自动使用读库
+
+        结果按 chunk_size 分批从数据库取回，不会一次性加载整张表。
+
+        Args:
+            chunk_size: 每批从游标读取的记录数
+
+        Yields:
+            模型实例
+
+        Example:
+            async for user in User.where('status', 'active').stream(500):
+                process(user)
+        """
+        from fastorm.connection.database import session as db_session
+
+        query = self._build_query().execution_options(yield_per=chunk_size)
+
+        # 已有当前session时直接复用；否则单独打开session且不写入上下文变量。
+        # 调用方提前 break 时生成器挂起在 yield 处，若把session设为当前session，
+        # 之后的操作会误用这个不会提交的session
+        current_session = SessionManager.get_session()
+        session_scope = (
+            nullcontext(current_session)
+            if current_session is not None
+            else db_session(connection_type=self._get_session_type())
+        )
+
+        async with session_scope as session:
+            result = await session.stream(query)
+            async for partition in result.scalars().partitions(chunk_size):
+                for instance in partition:
+                    yield instance
+
     async def first(self) -> T | None:
         """获取第一条记录 - 自动使用读库
 
@@ -369,12 +450,26 @@ class QueryBuilder(Generic[T]):
         Example:
             exists = await User.where('email', email).exists()
         """
-        count = await self.count()
-        return count > 0
+
+        async def _exists(session: AsyncSession) -> bool:
+            # SELECT 1 ... LIMIT 1，命中第一行即返回，无需统计全部记录
+            exists_query = select(literal(1)).select_from(self._model_class)
+
+            if self._conditions:
+                exists_query = exists_query.where(and_(*self._conditions))
+
+            result = await session.execute(exists_query.limit(1))
+            return result.first() is not None
+
+        session_type = self._get_session_type()
+        return await execute_with_session(_exists, connection_type=session_type)
 
     async def delete(self) -> int:
         """删除匹配的记录 - 自动使用写库
 
+        以单条 ``DELETE ... WHERE`` 语句批量执行，不加载记录，
+        因此不会触发模型实例的删除事件。
+
         Returns:
             删除的记录数量
 
@@ -390,7 +485,10 @@ class QueryBuilder(Generic[T]):
             if self._conditions:
                 delete_query = delete_query.where(and_(*self._conditions))
 
-            result = await session.execute(delete_query)
+            # 单条 DELETE 语句；不同步会话中的对象，省去 RETURNING 主键和逐行匹配
+            result = await session.execute(
+                delete_query.execution_options(synchronize_session=False)
+            )
             return result.rowcount
 
         # 删除操作强制使用写库
@@ -399,6 +497,9 @@ class QueryBuilder(Generic[T]):
     async def update(self, **values: Any) -> int:
         """更新匹配的记录 - 自动使用写库
 
+        以单条 ``UPDATE ... WHERE`` 语句批量执行，不加载记录，
+        因此不会触发模型实例的更新事件。
+
         Args:
             **values: 要更新的字段值
 
@@ -420,7 +521,9 @@ class QueryBuilder(Generic[T]):
             # 添加更新值
             update_query = update_query.values(**values)
 
-            result = await session.execute(update_query)
+            result = await session.execute(
+                update_query.execution_options(synchronize_session=False)
+            )
             return result.rowcount
 
         # 更新操作强制使用写库
@@ -457,8 +560,6 @@ class QueryBuilder(Generic[T]):
             for user in paginator.items:
                 print(user.name)
         """
-        from fastorm.query.pagination import create_paginator
-
         # 计算偏移量
         offset = (page - 1) * per_page
 
@@ -499,8 +600,6 @@ class QueryBuilder(Generic[T]):
             paginator = await User.where('status', 'active')\
                                   .simple_paginate(page=2, per_page=10)
         """
-        from fastorm.query.pagination import create_simple_paginator
-
         # 计算偏移量
         offset = (page - 1) * per_page
 
@@ -579,12 +678,12 @@ class QueryBuilder(Generic[T]):
         new_builder = QueryBuilder(self._model_class)
 
         # 复制条件
-        new_builder._conditions = source_builder._conditions.copy()
-        new_builder._order_clauses = source_builder._order_clauses.copy()
+        new_builder._conditions = source_builder._conditions
+        new_builder._order_clauses = source_builder._order_clauses
         new_builder._limit_value = source_builder._limit_value
         new_builder._offset_value = source_builder._offset_value
         new_builder._distinct_value = source_builder._distinct_value
-        new_builder._with_relations = source_builder._with_relations.copy()
+        new_builder._with_relations = source_builder._with_relations
         new_builder._force_write = source_builder._force_write
         new_builder._operation_type = source_builder._operation_type
 
@@ -600,17 +699,32 @@ class QueryBuilder(Generic[T]):
             instances: 模型实例列表
             session: 数据库会话
         """
+        if not instances:
+            return
+
+        relations = {}
         for relation_name in self._with_relations:
-            # 检查关系是否存在
-            if hasattr(self._model_class, relation_name):
-                # 为每个实例加载关系
-                for instance in instances:
-                    relation_obj = getattr(instance, relation_name)
-                    if hasattr(relation_obj, "load"):
-                        # RelationProxy的load方法不需要额外参数
-                        related_data = await relation_obj.load()
-                        # 设置关系属性
-                        setattr(instance, f"_{relation_name}_loaded", related_data)
+            relation = self._resolve_relation(relation_name)
+            if relation is not None:
+                relations[relation_name] = relation
+
+        # 每个关系一次 IN 查询，而不是每个实例一次查询
+        await RelationLoader.eager_load_relations(instances, relations, session)
+
+    def _resolve_relation(self, relation_name: str) -> Relation | None:
+        """获取模型上定义的关系对象
+
+        Args:
+            relation_name: 关系名称
+
+        Returns:
+            关系实例，未定义时返回None
+        """
+        relations = getattr(self._model_class, "_relations", None) or {}
+        relation = relations.get(relation_name)
+        if relation is None:
+            relation = getattr(self._model_class, relation_name, None)
+        return relation if isinstance(relation, Relation) else None
 
     # =================================================================
     # 关系查询方法
@@ -635,10 +749,12 @@ class QueryBuilder(Generic[T]):
         ```
         """
         if isinstance(relations, str):
-            self._with_relations[relations] = None
-        else:
-            for relation in relations:
-                self._with_relations[relation] = None
+            relations = [relations]
+        # 关系字典可能与其他构建器共享，替换而不是原地修改
+        self._with_relations = {
+            **self._with_relations,
+            **dict.fromkeys(relations, None),
+        }
         return self
 
     def where_has(
@@ -214,16 +214,14 @@ class QueryCacheSupport:
         # 添加WHERE条件
         if hasattr(self, "_wheres") and self._wheres:
             where_str = json.dumps(self._wheres, sort_keys=True, default=str)
-            query_parts.append(
-                f"where:{hashlib.md5(where_str.encode()).hexdigest()[:8]}"
-            )
+            where_hash = hashlib.blake2b(where_str.encode(), digest_size=4)
+            query_parts.append(f"where:{where_hash.hexdigest()}")
 
         # 添加ORDER BY
         if hasattr(self, "_orders") and self._orders:
             order_str = json.dumps(self._orders, sort_keys=True, default=str)
-            query_parts.append(
-                f"order:{hashlib.md5(order_str.encode()).hexdigest()[:8]}"
-            )
+            order_hash = hashlib.blake2b(order_str.encode(), digest_size=4)
+            query_parts.append(f"order:{order_hash.hexdigest()}")
 
         # 添加LIMIT和OFFSET
         if hasattr(self, "_limit") and self._limit:
@@ -235,13 +233,14 @@ class QueryCacheSupport:
         # 添加SELECT字段
         if hasattr(self, "_columns") and self._columns:
             columns_str = json.dumps(sorted(self._columns), default=str)
-            query_parts.append(
-                f"select:{hashlib.md5(columns_str.encode()).hexdigest()[:8]}"
-            )
+            columns_hash = hashlib.blake2b(columns_str.encode(), digest_size=4)
+            query_parts.append(f"select:{columns_hash.hexdigest()}")
 
         # 生成最终键
         query_signature = ":".join(query_parts)
-        query_hash = hashlib.md5(query_signature.encode()).hexdigest()[:12]
+        query_hash = hashlib.blake2b(
+            query_signature.encode(), digest_size=6
+        ).hexdigest()
 
         return f"fastorm:query:{model_name}:{query_hash}"
 
@@ -0,0 +1,91 @@
+"""
+FastORM 预编译查询
+
+将查询构建器固化为可重复执行的查询对象，适用于在循环中反复执行的同一查询。
+
+示例:
+```python
+# 只构建一次查询
+stmt = User.where('age', '>', 20).limit(5).compile()
+
+# 循环中直接执行，不再重复链式构建
+for _ in range(10):
+    users = await stmt.get()
+```
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastorm.core.session_manager import execute_with_session
+
+T = TypeVar("T")
+
+if TYPE_CHECKING:
+    from sqlalchemy.sql import Select
+
+    from fastorm.query.builder import QueryBuilder
+
+
+class CompiledQuery(Generic[T]):
+    """预编译查询
+
+    在创建时一次性生成SQLAlchemy语句并确定会话类型，之后每次执行都复用
+    同一个语句对象，省去链式构建和条件组装的开销。SQLAlchemy 会按语句的
+    缓存键复用已编译的SQL。
+    """
+
+    def __init__(self, builder: QueryBuilder[T]):
+        self._builder = builder
+        self._statement: Select = builder._build_query()
+        self._first_statement: Select = self._statement.limit(1)
+        self._session_type: str = builder._get_session_type()
+
+    @property
+    def statement(self) -> Select:
+        """预编译的SQLAlchemy语句"""
+        return self._statement
+
+    async def get(self) -> list[T]:
+        """执行查询并获取所有结果
+
+        Returns:
+            模型实例列表
+        """
+
+        async def _get(session: AsyncSession) -> list[T]:
+            result = await session.execute(self._statement)
+            instances = list(result.scalars().all())
+
+            if self._builder._with_relations:
+                await self._builder._load_relations(instances, session)
+
+            return instances
+
+        return await execute_with_session(_get, connection_type=self._session_type)
+
+    async def first(self) -> T | None:
+        """获取第一条记录
+
+        Returns:
+            模型实例或None
+        """
+
+        async def _first(session: AsyncSession) -> T | None:
+            result = await session.execute(self._first_statement)
+            instance = result.scalars().first()
+
+            if instance and self._builder._with_relations:
+                await self._builder._load_relations([instance], session)
+
+            return instance
+
+        return await execute_with_session(
+            _first, connection_type=self._session_type
+        )
+
+    def __repr__(self) -> str:
+        return f"<CompiledQuery {self._builder._model_class.__name__}>"
@@ -71,11 +71,11 @@ class SoftDeleteQueryBuilder(QueryBuilder):
         if self.only_deleted:
             # 仅查询已删除记录
             condition = deleted_at_column.is_not(None)
-            self._conditions.append(condition)
+            self._conditions += (condition,)
         elif not self.include_deleted:
             # 排除已删除记录（默认行为）
             condition = deleted_at_column.is_(None)
-            self._conditions.append(condition)
+            self._conditions += (condition,)
         # include_deleted=True 时不添加任何过滤器
 
     def _reapply_soft_delete_filter(self) -> None:
@@ -84,18 +84,18 @@ class SoftDeleteQueryBuilder(QueryBuilder):
         deleted_at_column = getattr(self._model_class, column_name)
 
         # 移除之前的软删除条件
-        self._conditions = [
+        self._conditions = tuple(
             condition for condition in self._conditions
             if not self._is_soft_delete_condition(condition, deleted_at_column)
-        ]
+        )
 
         # 应用新的软删除过滤器
         if self.only_deleted:
             condition = deleted_at_column.is_not(None)
-            self._conditions.append(condition)
+            self._conditions += (condition,)
         elif not self.include_deleted:
             condition = deleted_at_column.is_(None)
-            self._conditions.append(condition)
+            self._conditions += (condition,)
 
     def _is_soft_delete_condition(self, condition, deleted_at_column) -> bool:
         """检查条件是否是软删除相关的条件"""
@@ -227,9 +227,9 @@ class SoftDeleteQueryBuilder(QueryBuilder):
 
         # 复制查询状态
         cloned._query = self._query
-        cloned._conditions = self._conditions.copy()
-        cloned._with_relations = self._with_relations.copy()
-        cloned._order_clauses = self._order_clauses.copy()
+        cloned._conditions = self._conditions
+        cloned._with_relations = self._with_relations
+        cloned._order_clauses = self._order_clauses
         cloned._limit_value = self._limit_value
         cloned._offset_value = self._offset_value
         cloned._distinct_value = self._distinct_value
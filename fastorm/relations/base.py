@@ -127,6 +127,20 @@ class Relation(Generic[T], ABC):
         """
         pass
 
+    async def eager_load(self, parents: list[Any], session: AsyncSession) -> list[T]:
+        """为多个父实例批量加载关联数据
+
+        默认逐个调用 load()，子类可覆盖为单次 IN 查询以避免N+1。
+
+        Args:
+            parents: 父模型实例列表
+            session: 数据库会话
+
+        Returns:
+            与 parents 一一对应的关联数据列表
+        """
+        return [await self.load(parent, session) for parent in parents]
+
     def get_foreign_key(self, parent: Any) -> str:
         """获取外键字段名
 
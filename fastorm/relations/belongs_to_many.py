@@ -6,10 +6,15 @@ FastORM BelongsToMany 关系
 
 from __future__ import annotations
 
+from itertools import repeat
 from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import column
+from sqlalchemy import delete
+from sqlalchemy import insert
 from sqlalchemy import select
-from sqlalchemy import text
+from sqlalchemy import table
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from fastorm.core.session_manager import execute_with_session
 
@@ -17,6 +22,7 @@ from .base import Relation
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.sql.expression import TableClause
 
 
 class BelongsToMany(Relation[list[Any]]):
@@ -70,6 +76,11 @@ class BelongsToMany(Relation[list[Any]]):
         self.related_key = related_key
         self.related_local_key = related_local_key
 
+        # 推断出的名称只取决于模型类，按父模型类缓存
+        self._resolved_pivot_tables: dict[type, str] = {}
+        self._resolved_foreign_keys: dict[type, str] = {}
+        self._resolved_related_key: str | None = None
+
     async def load(self, parent: Any, session: AsyncSession) -> list[Any]:
         """加载关联数据
 
@@ -85,22 +96,19 @@ class BelongsToMany(Relation[list[Any]]):
         if local_key_value is None:
             return []
 
-        # 获取配置
-        pivot_table = self.get_pivot_table(parent)
+        pivot = self.get_pivot_clause(parent)
         foreign_key = self.get_foreign_key(parent)
         related_key = self.get_related_key()
 
-        # 构建联合查询
+        # 构建联合查询，本地键值作为绑定参数
         query = (
             select(self.model_class)
-            .select_from(
-                self.model_class.__table__.join(
-                    text(pivot_table),
-                    getattr(self.model_class, self.related_local_key)
-                    == text(f"{pivot_table}.{related_key}"),
-                )
+            .join(
+                pivot,
+                getattr(self.model_class, self.related_local_key)
+                == pivot.c[related_key],
             )
-            .where(text(f"{pivot_table}.{foreign_key}") == local_key_value)
+            .where(pivot.c[foreign_key] == local_key_value)
         )
 
         # 执行查询
@@ -121,27 +129,59 @@ class BelongsToMany(Relation[list[Any]]):
         if self.pivot_table:
             return self.pivot_table
 
-        # 自动推断中间表名：按字母顺序排列的表名
-        tables = sorted(
-            [parent.__class__.__tablename__, self.model_class.__tablename__]
-        )
-        return f"{tables[0]}_{tables[1]}"
+        parent_class = parent.__class__
+        pivot_table = self._resolved_pivot_tables.get(parent_class)
+        if pivot_table is None:
+            # 自动推断中间表名：按字母顺序排列的表名
+            tables = sorted(
+                [parent_class.__tablename__, self.model_class.__tablename__]
+            )
+            pivot_table = f"{tables[0]}_{tables[1]}"
+            self._resolved_pivot_tables[parent_class] = pivot_table
+        return pivot_table
 
     def get_foreign_key(self, parent: Any) -> str:
         """获取当前模型在中间表中的外键名"""
         if self.foreign_key:
             return self.foreign_key
 
-        # 自动推断：父模型名_id
-        return f"{parent.__class__.__name__.lower()}_id"
+        parent_class = parent.__class__
+        foreign_key = self._resolved_foreign_keys.get(parent_class)
+        if foreign_key is None:
+            # 自动推断：父模型名_id
+            foreign_key = f"{parent_class.__name__.lower()}_id"
+            self._resolved_foreign_keys[parent_class] = foreign_key
+        return foreign_key
 
     def get_related_key(self) -> str:
         """获取关联模型在中间表中的外键名"""
         if self.related_key:
             return self.related_key
 
-        # 自动推断：关联模型名_id
-        return f"{self.model_class.__name__.lower()}_id"
+        if self._resolved_related_key is None:
+            # 自动推断：关联模型名_id
+            self._resolved_related_key = f"{self.model_class.__name__.lower()}_id"
+        return self._resolved_related_key
+
+    def get_pivot_clause(self, parent: Any, *extra_columns: str) -> TableClause:
+        """获取中间表的轻量表结构
+
+        包含两列外键及指定的额外列，用于以 Core 表达式构建中间表语句，
+        所有值都以绑定参数传入。
+
+        Args:
+            parent: 父模型实例
+            *extra_columns: 中间表额外数据的列名
+
+        Returns:
+            中间表的 TableClause
+        """
+        return table(
+            self.get_pivot_table(parent),
+            column(self.get_foreign_key(parent)),
+            column(self.get_related_key()),
+            *(column(name) for name in extra_columns),
+        )
 
     # =================================================================
     # Laravel风格的多对多关系操作方法
@@ -167,41 +207,40 @@ class BelongsToMany(Relation[list[Any]]):
             else:
                 id_list = ids
 
-            pivot_table = self.get_pivot_table(parent)
+            if not id_list:
+                return
+
             foreign_key = self.get_foreign_key(parent)
             related_key = self.get_related_key()
             local_key_value = self.get_local_key_value(parent)
 
-            # 构建插入数据
-            insert_data = []
+            # 列式构建插入参数：外键和中间表额外数据对每行都相同，
+            # 用 repeat 与关联ID并行拉链
             base_data = pivot_data or {}
+            columns = [foreign_key, related_key, *base_data]
+            rows = [
+                dict(zip(columns, row, strict=True))
+                for row in zip(
+                    repeat(local_key_value),
+                    id_list,
+                    *(repeat(value) for value in base_data.values()),
+                )
+            ]
 
-            for related_id in id_list:
-                row_data = {
-                    foreign_key: local_key_value,
-                    related_key: related_id,
-                    **base_data,
-                }
-                insert_data.append(row_data)
-
-            # 批量插入中间表
-            if insert_data:
-                await session.execute(
-                    text(f"""
-                        INSERT OR IGNORE INTO {pivot_table} 
-                        ({', '.join(insert_data[0].keys())}) 
-                        VALUES {', '.join([
-                            f"({', '.join([':' + k + str(i) for k in row.keys()])})"
-                            for i, row in enumerate(insert_data)
-                        ])}
-                    """),
-                    {
-                        f"{k}{i}": v
-                        for i, row in enumerate(insert_data)
-                        for k, v in row.items()
-                    },
+            # 已存在的关联直接忽略，各方言使用各自的冲突处理语法
+            pivot = self.get_pivot_clause(parent, *base_data)
+            if session.get_bind().dialect.name == "postgresql":
+                stmt = pg_insert(pivot).on_conflict_do_nothing()
+            else:
+                stmt = (
+                    insert(pivot)
+                    .prefix_with("OR IGNORE", dialect="sqlite")
+                    .prefix_with("IGNORE", dialect="mysql")
                 )
 
+            # 单条参数化语句 + executemany 批量插入中间表
+            await session.execute(stmt, rows)
+
         await execute_with_session(_attach)
 
     async def detach(self, parent: Any, ids: int | list[int] | None = None) -> None:
@@ -213,37 +252,27 @@ class BelongsToMany(Relation[list[Any]]):
         """
 
         async def _detach(session: AsyncSession) -> None:
-            pivot_table = self.get_pivot_table(parent)
+            pivot = self.get_pivot_clause(parent)
             foreign_key = self.get_foreign_key(parent)
             related_key = self.get_related_key()
             local_key_value = self.get_local_key_value(parent)
 
-            if ids is None:
-                # 分离所有关联
-                await session.execute(
-                    text(f"DELETE FROM {pivot_table} WHERE {foreign_key} = :local_id"),
-                    {"local_id": local_key_value},
-                )
-            else:
+            stmt = delete(pivot).where(pivot.c[foreign_key] == local_key_value)
+
+            if ids is not None:
                 # 分离指定ID
                 if isinstance(ids, (int, str)):
                     id_list = [ids]
                 else:
                     id_list = ids
 
-                if id_list:
-                    placeholders = ", ".join([f":id{i}" for i in range(len(id_list))])
-                    await session.execute(
-                        text(f"""
-                            DELETE FROM {pivot_table} 
-                            WHERE {foreign_key} = :local_id 
-                            AND {related_key} IN ({placeholders})
-                        """),
-                        {
-                            "local_id": local_key_value,
-                            **{f"id{i}": v for i, v in enumerate(id_list)},
-                        },
-                    )
+                if not id_list:
+                    return
+
+                # IN 列表为扩展参数，不同数量的ID共用同一份编译结果
+                stmt = stmt.where(pivot.c[related_key].in_(id_list))
+
+            await session.execute(stmt)
 
         await execute_with_session(_detach)
 
@@ -295,17 +324,16 @@ class BelongsToMany(Relation[list[Any]]):
             else:
                 id_list = ids
 
-            pivot_table = self.get_pivot_table(parent)
+            pivot = self.get_pivot_clause(parent)
             foreign_key = self.get_foreign_key(parent)
             related_key = self.get_related_key()
             local_key_value = self.get_local_key_value(parent)
 
             # 获取当前关联的ID
             current_ids_result = await session.execute(
-                text(
-                    f"SELECT {related_key} FROM {pivot_table} WHERE {foreign_key} = :local_id"
-                ),
-                {"local_id": local_key_value},
+                select(pivot.c[related_key]).where(
+                    pivot.c[foreign_key] == local_key_value
+                )
             )
             current_ids = {row[0] for row in current_ids_result}
 
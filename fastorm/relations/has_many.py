@@ -44,6 +44,24 @@ class HasMany(Relation[list[Any]]):
     ```
     """
 
+    def __init__(
+        self,
+        model_class: type[Any] | str,
+        foreign_key: str | None = None,
+        local_key: str = "id",
+    ):
+        """初始化一对多关系
+
+        Args:
+            model_class: 关联的模型类或类名字符串
+            foreign_key: 关联模型中指向父模型的外键，如果为None则自动推断
+            local_key: 父模型的本地键，默认为'id'
+        """
+        super().__init__(model_class, foreign_key, local_key)
+
+        # 推断出的外键名只取决于父模型类，按父模型类缓存
+        self._resolved_foreign_keys: dict[type, str] = {}
+
     async def load(self, parent: Any, session: AsyncSession) -> list[Any]:
         """加载关联数据
 
@@ -54,35 +72,71 @@ class HasMany(Relation[list[Any]]):
         Returns:
             关联的模型实例列表
         """
-        # 获取本地键值
-        local_key_value = self.get_local_key_value(parent)
-        if local_key_value is None:
-            return []
+        # 与批量预加载共用同一条 IN 查询
+        return (await self.eager_load([parent], session))[0]
+
+    async def eager_load(
+        self, parents: list[Any], session: AsyncSession
+    ) -> list[list[Any]]:
+        """批量加载多个父实例的关联数据
+
+        使用一条 ``WHERE foreign_key IN (...)`` 查询取回全部子记录，
+        再按外键分组回填到各父实例。
+
+        Args:
+            parents: 父模型实例列表
+            session: 数据库会话
 
-        # 获取外键名
-        foreign_key = self.get_foreign_key(parent)
+        Returns:
+            与 parents 一一对应的关联实例列表
+        """
+        if not parents:
+            return []
 
-        # 构建查询
-        query = select(self.model_class).where(
-            getattr(self.model_class, foreign_key) == local_key_value
-        )
+        foreign_key = self.get_foreign_key(parents[0])
+        local_key_values = [self.get_local_key_value(parent) for parent in parents]
+        ids = {value for value in local_key_values if value is not None}
 
-        # 执行查询
-        result = await session.execute(query)
-        instances = result.scalars().all()
+        buckets: dict[Any, list[Any]] = {}
+        if ids:
+            query = select(self.model_class).where(
+                getattr(self.model_class, foreign_key).in_(ids)
+            )
+            result = await session.execute(query)
+            for instance in result.scalars():
+                buckets.setdefault(getattr(instance, foreign_key), []).append(
+                    instance
+                )
 
-        return instances
+        return [buckets.get(value, []) for value in local_key_values]
 
     def get_foreign_key(self, parent: Any) -> str:
         """获取外键字段名
 
-        对于HasMany关系，外键在关联模型中，指向父模型
+        对于HasMany关系，外键在关联模型中，指向父模型。
+        推断出的外键名按父模型类缓存在关系对象上。
         """
         if self.foreign_key:
             return self.foreign_key
 
-        # 自动推断：父模型名_id
-        return f"{parent.__class__.__name__.lower()}_id"
+        parent_class = type(parent)
+        foreign_key = self._resolved_foreign_keys.get(parent_class)
+        if foreign_key is None:
+            # 自动推断：父模型名_id
+            foreign_key = f"{parent_class.__name__.lower()}_id"
+            self._resolved_foreign_keys[parent_class] = foreign_key
+        return foreign_key
+
+    def get_local_key_value(self, parent: Any) -> Any:
+        """获取本地键的值
+
+        已加载的列值直接从实例 ``__dict__`` 读取，绕过SQLAlchemy的属性
+        描述符；未加载或已过期时回退到 getattr 以触发正常加载。
+        """
+        try:
+            return parent.__dict__[self.local_key]
+        except (AttributeError, KeyError):
+            return getattr(parent, self.local_key, None)
 
     # =================================================================
     # 关系操作方法
@@ -156,19 +210,14 @@ class HasMany(Relation[list[Any]]):
             foreign_key = self.get_foreign_key(parent)
             local_key_value = self.get_local_key_value(parent)
 
-            saved_instances = []
             for instance in instances:
                 setattr(instance, foreign_key, local_key_value)
-                session.add(instance)
-                saved_instances.append(instance)
 
+            # 一次性加入会话，flush后主键和默认值已回填
+            session.add_all(instances)
             await session.flush()
 
-            # 刷新所有实例
-            for instance in saved_instances:
-                await session.refresh(instance)
-
-            return saved_instances
+            return list(instances)
 
         return await execute_with_session(_save_many)
 
@@ -62,6 +62,36 @@ class HasOne(Relation[Any]):
 
         return instance
 
+    async def eager_load(
+        self, parents: list[Any], session: AsyncSession
+    ) -> list[Any | None]:
+        """批量加载多个父实例的关联数据
+
+        Args:
+            parents: 父模型实例列表
+            session: 数据库会话
+
+        Returns:
+            与 parents 一一对应的关联实例（不存在时为None）
+        """
+        if not parents:
+            return []
+
+        foreign_key = self.get_foreign_key(parents[0])
+        local_key_values = [self.get_local_key_value(parent) for parent in parents]
+        ids = {value for value in local_key_values if value is not None}
+
+        related: dict[Any, Any] = {}
+        if ids:
+            query = select(self.model_class).where(
+                getattr(self.model_class, foreign_key).in_(ids)
+            )
+            result = await session.execute(query)
+            for instance in result.scalars():
+                related.setdefault(getattr(instance, foreign_key), instance)
+
+        return [related.get(value) for value in local_key_values]
+
     def get_foreign_key(self, parent: Any) -> str:
         """获取外键字段名
 
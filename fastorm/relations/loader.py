@@ -80,11 +80,11 @@ class RelationLoader:
             session: 数据库会话
         """
         for relation_name, relation in relations.items():
-            # 为每个实例加载关系
-            for instance in instances:
-                await RelationLoader.load_relation(
-                    instance, relation_name, relation, session
-                )
+            # 每个关系只发起一次批量查询
+            results = await relation.eager_load(instances, session)
+            for instance, result in zip(instances, results, strict=True):
+                setattr(instance, f"_{relation_name}_cache", result)
+                setattr(instance, f"_{relation_name}_loaded", True)
 
     @staticmethod
     def get_relation_cache(parent: Any, relation_name: str) -> Any:
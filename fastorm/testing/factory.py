@@ -30,6 +30,7 @@ admin = await UserFactory.create(trait='admin')
 
 from __future__ import annotations
 
+import itertools
 from collections.abc import Callable
 from functools import wraps
 from typing import (
@@ -63,17 +64,15 @@ class Sequence:
     def __init__(self, function: Callable[[int], Any], start: int = 1):
         self.function = function
         self.start = start
-        self._counter = start
+        self._counter = itertools.count(start)
 
     def next(self) -> Any:
         """获取下一个序列值"""
-        value = self.function(self._counter)
-        self._counter += 1
-        return value
+        return self.function(next(self._counter))
 
     def reset(self, start: int | None = None) -> None:
         """重置序列计数器"""
-        self._counter = start if start is not None else self.start
+        self._counter = itertools.count(start if start is not None else self.start)
 
 
 class FactoryTrait:
@@ -139,6 +138,10 @@ class FactoryMetaclass(type):
             if key.startswith("_") or key == "Meta":
                 continue
 
+            # 跳过工厂自身的类方法/静态方法定义
+            if isinstance(value, (classmethod, staticmethod, property)):
+                continue
+
             # 处理特征方法
             if callable(value) and hasattr(value, "_is_trait") and value._is_trait:
                 traits[value._trait_name] = value
@@ -249,13 +252,8 @@ class Factory(metaclass=FactoryMetaclass):
             users = await UserFactory.create_batch(10)
             admins = await UserFactory.create_batch(5, trait='admin')
         """
-        instances = []
-
-        for _ in range(count):
-            instance = await cls.create(trait=trait, **overrides)
-            instances.append(instance)
-
-        return instances
+        create = cls.create
+        return [await create(trait=trait, **overrides) for _ in range(count)]
 
     @classmethod
     async def build(cls, trait: str | None = None, **overrides: Any) -> T:
@@ -297,13 +295,8 @@ class Factory(metaclass=FactoryMetaclass):
         Returns:
             构建的模型实例列表（未保存）
         """
-        instances = []
-
-        for _ in range(count):
-            instance = await cls.build(trait=trait, **overrides)
-            instances.append(instance)
-
-        return instances
+        build = cls.build
+        return [await build(trait=trait, **overrides) for _ in range(count)]
 
     @classmethod
     async def _build_attributes(
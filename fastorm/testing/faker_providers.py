@@ -442,38 +442,44 @@ class TestDataProvider(BaseProvider):
 
 
 # 创建全局faker实例并注册提供者
+# 多语言模式下代理对象不支持add_provider，需要逐个语言注册
 faker = Faker(["zh_CN", "en_US"])
-faker.add_provider(ChineseProvider)
-faker.add_provider(CompanyProvider)
-faker.add_provider(TestDataProvider)
+for _locale_generator in faker.factories:
+    _locale_generator.add_provider(ChineseProvider)
+    _locale_generator.add_provider(CompanyProvider)
+    _locale_generator.add_provider(TestDataProvider)
+
+# 自定义提供者与语言无关，便捷函数直接绑定到单个生成器，
+# 跳过多语言代理每次调用时的 __getattr__ 和随机选择语言
+_generator = faker["zh_CN"]
 
 
 # 便捷函数
 def chinese_name() -> str:
     """生成中文姓名"""
-    return faker.chinese_name()
+    return _generator.chinese_name()
 
 
 def chinese_phone() -> str:
     """生成中国手机号"""
-    return faker.chinese_phone()
+    return _generator.chinese_phone()
 
 
 def company_email(name: str | None = None) -> str:
     """生成企业邮箱"""
-    return faker.company_email(name)
+    return _generator.company_email(name)
 
 
 def department() -> str:
     """生成部门名称"""
-    return faker.department()
+    return _generator.department()
 
 
 def employee_id() -> str:
     """生成员工ID"""
-    return faker.employee_id()
+    return _generator.employee_id()
 
 
 def api_key(length: int = 32) -> str:
     """生成API密钥"""
-    return faker.api_key(length)
+    return _generator.api_key(length)
@@ -28,6 +28,7 @@ from __future__ import annotations
 import asyncio
 import inspect
 from abc import ABC
+from abc import ABCMeta
 from abc import abstractmethod
 from datetime import datetime
 from typing import Any
@@ -81,7 +82,7 @@ class SeederRegistry:
         cls._execution_order.clear()
 
 
-class SeederMetaclass(type):
+class SeederMetaclass(ABCMeta):
     """Seeder元类 - 自动注册Seeder"""
 
     def __new__(mcs, name: str, bases: tuple, namespace: dict[str, Any]):
@@ -16,6 +16,7 @@ from fastorm import Model, Database
 from fastorm.connection.database import init, close, create_all
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy import String, Integer
+from sqlalchemy.pool import StaticPool
 
 
 class TestUser(Model):
@@ -37,7 +38,13 @@ async def test_basic_functionality():
     try:
         # 1. 初始化数据库连接
         print("1. 初始化数据库连接...")
-        db = init("sqlite+aiosqlite:///:memory:", echo=True)
+        # 内存数据库固定到单个连接，避免各步骤间重建数据库
+        db = init(
+            "sqlite+aiosqlite:///:memory:",
+            echo=True,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
         print("   ✅ 数据库连接初始化成功")
         
         # 2. 创建表
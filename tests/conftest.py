@@ -5,17 +5,19 @@ FastORM 测试配置
 """
 
 import asyncio
+from contextlib import contextmanager
 import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, Mapped, mapped_column
-from sqlalchemy import String, Integer, Text, ForeignKey
+from sqlalchemy import String, Integer, Text, ForeignKey, event
 from fastorm import Model
 from fastorm.connection.database import init, close, create_all
 
 
-# 测试数据库URL - 使用SQLite内存数据库
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# 测试数据库URL - 使用共享缓存的SQLite内存数据库，
+# 连接池中的所有连接以及各个引擎看到的是同一个库
+TEST_DATABASE_URL = "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true"
 
 
 class TestUser(Model):
@@ -98,21 +100,71 @@ async def test_session(test_engine):
         yield session
 
 
-@pytest_asyncio.fixture
-async def test_database():
-    """初始化测试数据库"""
+_created_tables: set[str] = set()
+
+
+async def _ensure_tables() -> None:
+    """只为新注册的模型建表（测试中可能动态定义模型）"""
+    if not _created_tables.issuperset(Model.metadata.tables):
+        await create_all()
+        _created_tables.update(Model.metadata.tables)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def session_database():
+    """整个测试会话共享的数据库，只建一次连接"""
     # 使用全局便利函数 - 简洁明了
     db = init(TEST_DATABASE_URL, echo=False)
     
-    # 创建所有表
-    await create_all()
-    
     yield db
     
     # 清理连接
+    _created_tables.clear()
     await close()
 
 
+@pytest_asyncio.fixture
+async def test_database(session_database):
+    """初始化测试数据库"""
+    # 创建所有表
+    await _ensure_tables()
+    
+    yield session_database
+    
+    # 清空各表数据，保留表结构供后续测试复用
+    await _ensure_tables()
+    async with session_database.session() as session:
+        for table in reversed(Model.metadata.sorted_tables):
+            await session.execute(table.delete())
+
+
+@pytest.fixture
+def capture_sql(test_database):
+    """捕获代码块内发往数据库的SQL语句
+
+    用法::
+
+        with capture_sql() as statements:
+            await User.where('name', 'Alice').get()
+    """
+
+    @contextmanager
+    def _capture():
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = test_database.get_engine().sync_engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+    return _capture
+
+
 @pytest_asyncio.fixture
 async def sample_user(test_session):
     """创建测试用户"""
@@ -122,8 +174,8 @@ async def sample_user(test_session):
         age=25
     )
     test_session.add(user)
+    # expire_on_commit=False：提交后主键和默认值已回填，无需refresh
     await test_session.commit()
-    await test_session.refresh(user)
     return user
 
 
@@ -136,13 +188,9 @@ async def sample_users(test_session):
         TestUser(name="王五", email="wangwu@example.com", age=28),
     ]
     
-    for user in users:
-        test_session.add(user)
+    test_session.add_all(users)
     await test_session.commit()
     
-    for user in users:
-        await test_session.refresh(user)
-    
     return users
 
 
@@ -156,5 +204,4 @@ async def sample_post(test_session, sample_user):
     )
     test_session.add(post)
     await test_session.commit()
-    await test_session.refresh(post)
     return post 
\ No newline at end of file
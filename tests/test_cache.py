@@ -11,7 +11,10 @@ FastORM 缓存功能测试
 
 import pytest
 import asyncio
+import gc
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import AsyncMock, Mock
 from sqlalchemy import Column, Integer, String
 
@@ -27,7 +30,9 @@ from fastorm.cache import (
     forget,
     flush,
 )
+from fastorm.cache import _inflight
 from fastorm.cache.backends import CacheEntry
+from fastorm.model.cacheable import CacheableModel
 
 
 # =================================================================
@@ -159,6 +164,12 @@ class TestMemoryBackend:
         value = await memory_backend.get("key1")
         assert value is None
     
+    def test_memory_backend_nowait_operations(self, memory_backend):
+        """测试同步读写接口"""
+        assert memory_backend.set_nowait("sync_key", "sync_value", ttl=60) is True
+        assert memory_backend.get_nowait("sync_key") == "sync_value"
+        assert memory_backend.get_nowait("missing") is None
+
     @pytest.mark.asyncio
     async def test_memory_backend_ttl_expiration(self, memory_backend):
         """测试TTL过期功能"""
@@ -200,6 +211,18 @@ class TestMemoryBackend:
         # 验证其他标签的缓存仍然存在
         assert await memory_backend.get("post1") == "Hello"
     
+    @pytest.mark.asyncio
+    async def test_memory_backend_many_operations(self, memory_backend):
+        """测试批量设置和获取"""
+        items = {f"many{i}": f"value{i}" for i in range(5)}
+        assert await memory_backend.set_many(items, ttl=60, tags={"many"}) is True
+
+        values = await memory_backend.get_many(["many0", "missing", "many4"])
+        assert values == ["value0", None, "value4"]
+
+        assert await memory_backend.invalidate_tag("many") == 5
+        assert await memory_backend.get_many(list(items)) == [None] * 5
+
     @pytest.mark.asyncio
     async def test_memory_backend_max_size(self):
         """测试最大容量限制"""
@@ -221,6 +244,22 @@ class TestMemoryBackend:
         # 验证最旧的键被删除
         assert await backend.get("key1") is None
         assert await backend.get("key4") == "value4"
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_eviction_keeps_hot_keys(self):
+        """测试淘汰时保留近期访问过的键"""
+        backend = MemoryBackend(max_size=3)
+
+        await backend.set("hot", "value", ttl=60)
+        await backend.set("cold", "value", ttl=60)
+        await backend.set("warm", "value", ttl=60)
+        assert await backend.get("hot") == "value"
+
+        # 未被访问的cold先于hot被淘汰
+        await backend.set("new1", "value", ttl=60)
+        assert await backend.get("cold") is None
+        assert await backend.get("hot") == "value"
+        assert backend.get_stats()["total_keys"] == 3
     
     @pytest.mark.asyncio
     async def test_memory_backend_clear(self, memory_backend):
@@ -270,6 +309,7 @@ class TestCacheEntry:
         assert entry.value == "test_value"
         assert entry.tags == {"test"}
         assert not entry.is_expired()
+        assert not hasattr(entry, "__dict__")
     
     def test_cache_entry_expiration(self):
         """测试缓存条目过期"""
@@ -347,6 +387,80 @@ class TestCacheUtilityFunctions:
         result2 = await remember("async_key", 60, async_expensive_operation)
         assert result2 == "async_result_1"
         assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_remember_concurrent_misses(self):
+        """测试并发未命中时回调只执行一次"""
+        call_count = 0
+
+        async def slow_operation():
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return "shared_result"
+
+        results = await asyncio.gather(
+            *(remember("concurrent_key", 60, slow_operation) for _ in range(5))
+        )
+        assert results == ["shared_result"] * 5
+        assert call_count == 1
+
+        # 回调出错时所有等待者都收到异常，且不会留下加载中的任务
+        async def failing_operation():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *(remember("failing_key", 60, failing_operation) for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert await remember("failing_key", 60, lambda: "recovered") == "recovered"
+
+    @pytest.mark.asyncio
+    async def test_remember_cancelled_waiters(self, caplog):
+        """测试等待者全部取消后加载失败不报告未取回的异常"""
+        started = asyncio.Event()
+
+        async def failing_operation():
+            started.set()
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        waiter = asyncio.ensure_future(remember("cancel_key", 60, failing_operation))
+        await started.wait()
+        task = next(t for (_, k), t in _inflight.items() if k == "cancel_key")
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        # 加载任务不受取消影响，结束后异常已被取走
+        with caplog.at_level("ERROR", logger="asyncio"):
+            await asyncio.wait([task])
+            del task
+            gc.collect()
+        assert "never retrieved" not in caplog.text
+        assert not _inflight
+
+    def test_remember_separate_event_loops(self):
+        """测试不同事件循环中的remember互不共享加载任务"""
+        # 两个循环的回调都执行到这里才继续：若共享了加载任务，屏障会超时
+        barrier = threading.Barrier(2)
+
+        async def slow_operation():
+            barrier.wait(timeout=5)
+            await asyncio.sleep(0.01)
+            return "per_loop"
+
+        def run(_):
+            return asyncio.run(remember("loop_key", 60, slow_operation))
+
+        # 在线程中各自运行事件循环，同一时刻另一个循环的加载任务仍在进行
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(run, range(2)))
+
+        assert results == ["per_loop", "per_loop"]
+        assert not _inflight
     
     @pytest.mark.asyncio
     async def test_forget_function(self):
@@ -420,4 +534,21 @@ class TestCacheIntegration:
         
         # 验证缓存已失效
         cached_data = await cache_manager.get(cache_key)
-        assert cached_data is None 
\ No newline at end of file
+        assert cached_data is None
+
+    @pytest.mark.asyncio
+    async def test_cacheable_model_keys(self):
+        """测试模型缓存键使用预先拼好的头部"""
+
+        class KeyedUser(CacheableModel):
+            _cache_prefix = "test_fastorm"
+
+        assert await KeyedUser.cache_key_for_id(123) == (
+            "test_fastorm:model:keyeduser:123"
+        )
+
+        query_key = await KeyedUser.cache_key_for_query(status="active", age=20)
+        assert query_key.startswith("test_fastorm:query:keyeduser:")
+        assert query_key == await KeyedUser.cache_key_for_query(
+            age=20, status="active"
+        )
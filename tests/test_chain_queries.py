@@ -6,8 +6,10 @@ FastORM 链式查询测试
 
 import pytest
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, Integer, Boolean
+from sqlalchemy import String, Integer, Boolean, func, select
 from fastorm import Model
+from fastorm.core.session_manager import SessionManager
+from fastorm.query.batch import BatchDelete
 
 
 class ChainUser(Model):
@@ -30,10 +32,12 @@ class TestChainQueries:
     @pytest.mark.asyncio
     async def test_basic_where_queries(self, test_database):
         """测试基础where查询"""
-        # 使用FastORM的create方法创建测试数据
-        await ChainUser.create(name="Alice", email="alice@test.com", age=25, status="active")
-        await ChainUser.create(name="Bob", email="bob@test.com", age=30, status="inactive")
-        await ChainUser.create(name="Charlie", email="charlie@test.com", age=35, status="active")
+        # 批量插入测试数据：一条INSERT语句
+        await ChainUser.bulk_create([
+            {"name": "Alice", "email": "alice@test.com", "age": 25, "status": "active"},
+            {"name": "Bob", "email": "bob@test.com", "age": 30, "status": "inactive"},
+            {"name": "Charlie", "email": "charlie@test.com", "age": 35, "status": "active"},
+        ])
 
         # 测试等于查询
         active_users = await ChainUser.where('status', 'active').get()
@@ -50,6 +54,10 @@ class TestChainQueries:
         assert len(older_users) == 1
         assert older_users[0].name == 'Charlie'
 
+        # 操作符不区分大小写
+        like_users = await ChainUser.where('name', 'LIKE', 'Ali%').get()
+        assert [user.name for user in like_users] == ['Alice']
+
     @pytest.mark.asyncio
     async def test_chained_where_queries(self, test_database):
         """测试链式where查询"""
@@ -65,9 +73,11 @@ class TestChainQueries:
     @pytest.mark.asyncio
     async def test_query_builder_methods(self, test_database):
         """测试查询构建器方法"""
-        # 使用FastORM的create方法创建测试数据
-        await ChainUser.create(name="User1", email="user1@test.com", age=25)
-        await ChainUser.create(name="User2", email="user2@test.com", age=30)
+        # 批量插入测试数据
+        await ChainUser.bulk_create([
+            {"name": "User1", "email": "user1@test.com", "age": 25},
+            {"name": "User2", "email": "user2@test.com", "age": 30},
+        ])
 
         # 测试query()方法
         query_users = await ChainUser.query().get()
@@ -89,7 +99,7 @@ class TestChainQueries:
         assert len(offset_users) >= 1
 
     @pytest.mark.asyncio
-    async def test_aggregation_methods(self, test_database):
+    async def test_aggregation_methods(self, test_database, capture_sql):
         """测试聚合方法"""
         # 清理之前的数据，避免唯一约束冲突
         await ChainUser.delete_where('email', 'test3@example.com')
@@ -112,6 +122,47 @@ class TestChainQueries:
         non_exists = await ChainUser.where('name', 'NonExistent').exists()
         assert non_exists is False
 
+        # count/exists 直接查询表，不包裹子查询
+        with capture_sql() as statements:
+            await ChainUser.where('name', 'Test').count()
+            await ChainUser.where('name', 'Test').exists()
+
+        statements = [" ".join(sql.split()) for sql in statements]
+        assert len(statements) == 2
+        assert all("FROM chain_users WHERE" in sql for sql in statements)
+        assert all("(SELECT" not in sql for sql in statements)
+        assert statements[1].startswith("SELECT ?")
+        assert statements[1].endswith("LIMIT ? OFFSET ?")
+
+    @pytest.mark.asyncio
+    async def test_compiled_query(self, test_database):
+        """测试预编译查询重复执行"""
+        await ChainUser.delete_where('name', 'Compiled')
+        await ChainUser.create(name="Compiled", email="compiled1@test.com", age=40)
+        await ChainUser.create(name="Compiled", email="compiled2@test.com", age=45)
+
+        stmt = ChainUser.where('name', 'Compiled').order_by('age').compile()
+        assert stmt._session_type == 'read'
+
+        for _ in range(3):
+            users = await stmt.get()
+            assert [u.age for u in users] == [40, 45]
+
+        first_user = await stmt.first()
+        assert first_user.email == "compiled1@test.com"
+
+    @pytest.mark.asyncio
+    async def test_compiled_sql_reused_across_values(self, test_database):
+        """测试仅参数值不同的查询复用同一份编译结果"""
+        engine = test_database.get_engine()
+        compiled_cache = engine.sync_engine._compiled_cache
+        assert compiled_cache is not None
+
+        await ChainUser.where('name', 'Reuse1').where('age', '>', 1).get()
+        size = len(compiled_cache)
+        await ChainUser.where('name', 'Reuse2').where('age', '>', 2).get()
+        assert len(compiled_cache) == size
+
     @pytest.mark.asyncio
     async def test_force_write_queries(self, test_database):
         """测试强制写库查询"""
@@ -124,11 +175,13 @@ class TestChainQueries:
         assert result.name == 'WriteTest'
 
     @pytest.mark.asyncio
-    async def test_bulk_operations(self, test_database):
+    async def test_bulk_operations(self, test_database, capture_sql):
         """测试批量操作"""
-        # 使用FastORM的create方法创建测试数据
-        await ChainUser.create(name="Bulk1", email="bulk1@test.com", status="pending")
-        await ChainUser.create(name="Bulk2", email="bulk2@test.com", status="pending")
+        # 批量插入测试数据
+        await ChainUser.bulk_create([
+            {"name": "Bulk1", "email": "bulk1@test.com", "status": "pending"},
+            {"name": "Bulk2", "email": "bulk2@test.com", "status": "pending"},
+        ])
 
         # 测试批量更新
         updated_count = await ChainUser.where('status', 'pending').update(status='processed')
@@ -138,19 +191,119 @@ class TestChainQueries:
         processed_users = await ChainUser.where('status', 'processed').get()
         assert len(processed_users) >= 2
 
-        # 测试批量删除
-        deleted_count = await ChainUser.where('status', 'processed').delete()
+        # 测试批量删除：只发出一条DELETE语句
+        with capture_sql() as statements:
+            deleted_count = await ChainUser.where('status', 'processed').delete()
+
         assert deleted_count >= 2
+        assert len(statements) == 1
+        assert statements[0].startswith("DELETE FROM chain_users WHERE")
+        assert "RETURNING" not in statements[0]
 
     @pytest.mark.asyncio
-    async def test_error_handling(self, async_session, test_database):
-        """测试错误处理"""
-        # 创建表
-        async with async_session.begin():
-            await async_session.run_sync(
-                lambda sync_session: ChainUser.metadata.create_all(sync_session.bind)
+    async def test_batch_delete_single_statement(self, test_database, capture_sql):
+        """测试BatchDelete把多个条件合并为一条DELETE语句"""
+        await ChainUser.bulk_create([
+            {"name": f"Batch{i}", "email": f"batch{i}@test.com", "age": i}
+            for i in range(5)
+        ])
+        ids = [u.id for u in await ChainUser.where('name', 'like', 'Batch%').get()]
+
+        with capture_sql() as statements:
+            async with test_database.session() as session:
+                by_id = await BatchDelete(ChainUser).execute(
+                    session, [{"id": id_} for id_ in ids[:3]]
+                )
+                mixed = await BatchDelete(ChainUser).execute(
+                    session, [{"name": "Batch3", "age": 3}, {"email": "batch4@test.com"}]
+                )
+
+        assert by_id == {"deleted_count": 3}
+        assert mixed == {"deleted_count": 2}
+        deletes = [s for s in statements if s.startswith("DELETE")]
+        assert len(deletes) == 2
+        assert " IN (" in deletes[0]
+        assert " OR " in deletes[1]
+        assert await ChainUser.where('name', 'like', 'Batch%').count() == 0
+
+    @pytest.mark.asyncio
+    async def test_create_many(self, test_database):
+        """测试批量创建"""
+        users = await ChainUser.create_many([
+            {"name": "Many1", "email": "many1@test.com", "age": 21},
+            {"name": "Many2", "email": "many2@test.com"},
+            {"name": "Many3", "email": "many3@test.com", "age": 23},
+        ])
+
+        # 返回顺序与输入一致，主键和默认值已回填
+        assert [u.name for u in users] == ["Many1", "Many2", "Many3"]
+        assert all(u.id is not None for u in users)
+        assert all(u.status == "active" for u in users)
+        assert users[0].created_at is not None
+        assert users[1].age is None
+
+        assert await ChainUser.where('name', 'like', 'Many%').count() == 3
+        assert await ChainUser.create_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_create(self, test_database):
+        """测试批量插入"""
+        count = await ChainUser.bulk_create([
+            {"name": "BulkCreate1", "email": "bulkcreate1@test.com", "age": 31},
+            {"name": "BulkCreate2", "email": "bulkcreate2@test.com"},
+        ])
+        assert count == 2
+
+        users = await ChainUser.where('name', 'like', 'BulkCreate%').order_by('name').get()
+        assert [u.age for u in users] == [31, None]
+        # 列默认值照常生效
+        assert all(u.status == "active" for u in users)
+        assert all(u.created_at is not None for u in users)
+
+        assert await ChainUser.bulk_create([]) == 0
+
+    @pytest.mark.asyncio
+    async def test_stream(self, test_database):
+        """测试流式迭代查询结果"""
+        await ChainUser.create_many([
+            {"name": f"Stream{i}", "email": f"stream{i}@test.com", "age": i}
+            for i in range(5)
+        ])
+
+        ages = [
+            user.age
+            async for user in ChainUser.where('name', 'like', 'Stream%')
+            .order_by('age')
+            .stream(chunk_size=2)
+        ]
+        assert ages == [0, 1, 2, 3, 4]
+
+        streamed = [user async for user in ChainUser.stream(chunk_size=2)]
+        assert len(streamed) == await ChainUser.count()
+
+    @pytest.mark.asyncio
+    async def test_stream_early_break(self, test_database):
+        """测试提前中断流式迭代不会遗留当前session"""
+        await ChainUser.bulk_create([
+            {"name": f"Break{i}", "email": f"break{i}@test.com"} for i in range(5)
+        ])
+
+        async for _user in ChainUser.stream(chunk_size=2):
+            break
+
+        assert SessionManager.get_session() is None
+
+        # 之后的写操作照常在自己的session中提交
+        await ChainUser.create(name="AfterBreak", email="afterbreak@test.com")
+        async with test_database.session() as session:
+            result = await session.execute(
+                select(func.count()).select_from(ChainUser)
             )
+            assert result.scalar() == 6
 
+    @pytest.mark.asyncio
+    async def test_error_handling(self, test_database):
+        """测试错误处理"""
         # 测试无效字段名
         with pytest.raises(ValueError, match="Field invalid_field not found"):
             await ChainUser.where('invalid_field', 'value').get()
@@ -164,14 +317,8 @@ class TestChainQueries:
             await ChainUser.query().order_by('invalid_field').get()
 
     @pytest.mark.asyncio
-    async def test_query_builder_clone(self, async_session, test_database):
+    async def test_query_builder_clone(self, test_database):
         """测试查询构建器克隆"""
-        # 创建表
-        async with async_session.begin():
-            await async_session.run_sync(
-                lambda sync_session: ChainUser.metadata.create_all(sync_session.bind)
-            )
-
         # 测试克隆独立性
         base_query = ChainUser.where('status', 'active')
         modified_query = base_query.where('age', '>', 25)
@@ -179,16 +326,11 @@ class TestChainQueries:
         # 原查询条件数量应该保持不变
         assert len(base_query._conditions) == 1
         assert len(modified_query._conditions) == 2
+        assert modified_query._conditions[:1] == base_query._conditions
 
     @pytest.mark.asyncio
-    async def test_session_type_detection(self, async_session, test_database):
+    async def test_session_type_detection(self, test_database):
         """测试会话类型检测"""
-        # 创建表
-        async with async_session.begin():
-            await async_session.run_sync(
-                lambda sync_session: ChainUser.metadata.create_all(sync_session.bind)
-            )
-
         # 测试读操作使用读库
         read_builder = ChainUser.where('status', 'active')
         assert read_builder._get_session_type() == 'read'
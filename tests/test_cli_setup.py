@@ -0,0 +1,45 @@
+"""
+FastORM CLI setup 命令测试
+
+测试项目目录扫描辅助函数。
+"""
+
+from fastorm.cli.commands.setup_command import _iter_python_files
+
+
+class TestIterPythonFiles:
+    """Python文件遍历测试类"""
+
+    def test_iter_python_files(self, tmp_path):
+        """测试只返回.py文件、进入嵌套包并跳过排除目录"""
+        (tmp_path / "main.py").write_text("app = None\n")
+        (tmp_path / "README.md").write_text("# readme\n")
+        (tmp_path / "settings.pyc").write_bytes(b"")
+
+        package = tmp_path / "app" / "models"
+        package.mkdir(parents=True)
+        (tmp_path / "app" / "__init__.py").write_text("")
+        (package / "__init__.py").write_text("")
+        (package / "user.py").write_text("class User: ...\n")
+        (package / "schema.json").write_text("{}")
+
+        for excluded in ("__pycache__", ".git", ".venv", "venv", "build", "dist"):
+            directory = tmp_path / excluded / "nested"
+            directory.mkdir(parents=True)
+            (directory / "ignored.py").write_text("")
+
+        found = {
+            path.relative_to(tmp_path).as_posix()
+            for path in _iter_python_files(tmp_path)
+        }
+
+        assert found == {
+            "main.py",
+            "app/__init__.py",
+            "app/models/__init__.py",
+            "app/models/user.py",
+        }
+
+    def test_iter_python_files_missing_root(self, tmp_path):
+        """测试目录不存在时不抛出异常"""
+        assert list(_iter_python_files(tmp_path / "missing")) == []
@@ -0,0 +1,117 @@
+"""
+FastORM 数据库连接测试
+
+测试SQLite连接池选择和快速模式PRAGMA。
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+
+from fastorm.connection.adapters import SQLITE_FAST_PRAGMAS
+from fastorm.connection.adapters import get_optimal_engine_config
+from fastorm.connection.database import Database
+
+
+class TestSQLitePool:
+    """SQLite连接池选择测试类"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("url", [
+        "sqlite+aiosqlite:///:memory:",
+        "sqlite+aiosqlite://",
+        "sqlite+aiosqlite:///file:pool_test?mode=memory&uri=true",
+    ])
+    async def test_memory_database_keeps_static_pool(self, url):
+        """测试私有内存库使用StaticPool，所有会话共用同一个库"""
+        db = Database(url)
+        try:
+            assert isinstance(db.get_engine().pool, StaticPool)
+        finally:
+            await db.close()
+
+        assert get_optimal_engine_config(url)["poolclass"] is StaticPool
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("url", [
+        "sqlite+aiosqlite:///file:pool_test?mode=memory&cache=shared&uri=true",
+        "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true",
+    ])
+    async def test_shared_memory_database_uses_queue_pool(self, url):
+        """测试共享缓存内存库使用普通连接池，会话各自持有连接"""
+        db = Database(url)
+        try:
+            pool = db.get_engine().pool
+            assert isinstance(pool, AsyncAdaptedQueuePool)
+            assert pool.size() == 5
+        finally:
+            await db.close()
+
+    @pytest.mark.asyncio
+    async def test_file_database_uses_queue_pool(self, tmp_path):
+        """测试文件型SQLite使用固定大小的连接池"""
+        url = f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"
+        db = Database(url)
+        try:
+            pool = db.get_engine().pool
+            assert isinstance(pool, AsyncAdaptedQueuePool)
+            # 默认回滚日志模式只复用一个连接
+            assert pool.size() == 1
+        finally:
+            await db.close()
+
+        config = get_optimal_engine_config(url, fast_mode=True)
+        assert config["poolclass"] is AsyncAdaptedQueuePool
+        assert config["pool_size"] == 5
+        assert config["max_overflow"] == 10
+
+    @pytest.mark.asyncio
+    async def test_file_database_nested_sessions(self, tmp_path):
+        """测试文件型SQLite持有会话时仍可打开嵌套会话"""
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'nested.db'}")
+        try:
+            async with db.session() as outer:
+                await outer.execute(text("SELECT 1"))
+                async with db.session() as inner:
+                    assert (await inner.execute(text("SELECT 2"))).scalar() == 2
+        finally:
+            await db.close()
+
+
+class TestSQLiteFastMode:
+    """SQLite快速模式测试类"""
+
+    @staticmethod
+    async def _read_pragmas(db):
+        async with db.session() as session:
+            return {
+                name: (await session.execute(text(f"PRAGMA {name}"))).scalar()
+                for name in SQLITE_FAST_PRAGMAS
+            }
+
+    @pytest.mark.asyncio
+    async def test_fast_mode_applies_pragmas(self, tmp_path):
+        """测试fast_mode为每个新连接设置快速模式PRAGMA"""
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'fast.db'}", fast_mode=True)
+        try:
+            pragmas = await self._read_pragmas(db)
+        finally:
+            await db.close()
+
+        assert pragmas == {
+            "journal_mode": "wal",
+            "synchronous": 1,  # NORMAL
+            "temp_store": 2,  # MEMORY
+            "cache_size": -64000,
+        }
+
+    @pytest.mark.asyncio
+    async def test_default_mode_keeps_sqlite_defaults(self, tmp_path):
+        """测试未开启fast_mode时不修改PRAGMA"""
+        db = Database(f"sqlite+aiosqlite:///{tmp_path / 'default.db'}")
+        try:
+            pragmas = await self._read_pragmas(db)
+        finally:
+            await db.close()
+
+        assert pragmas["journal_mode"] == "delete"
@@ -9,10 +9,11 @@ FastORM 性能监控功能测试
 - 性能报告器
 """
 
+import asyncio
 import pytest
 import time
 from unittest.mock import Mock, patch
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, text
 from datetime import datetime, timedelta
 
 from fastorm.model.model import Model
@@ -76,6 +77,46 @@ class TestQueryProfiler:
         profiler.clear_sessions()
         assert len(profiler.sessions) == 0
 
+    @pytest.mark.asyncio
+    async def test_query_profiler_concurrent_sessions(self, test_database):
+        """测试并发任务中的分析会话互不干扰"""
+        profiler = QueryProfiler()
+
+        async def run(session_id, times):
+            async with profiler.async_profile(session_id) as session:
+                assert profiler.current_session_id == session_id
+                async with test_database.session() as db_session:
+                    for _ in range(times):
+                        await db_session.execute(text(f"SELECT '{session_id}'"))
+                        await asyncio.sleep(0)
+            return session
+
+        first, second = await asyncio.gather(run("task_a", 2), run("task_b", 3))
+        profiler.disable()
+
+        assert profiler.current_session_id is None
+        assert first.total_queries == 2
+        assert second.total_queries == 3
+        assert all("task_a" in q.sql for q in first.queries)
+        assert all("task_b" in q.sql for q in second.queries)
+
+
+    def test_query_profiler_nested_instances(self):
+        """测试多个分析器实例在同一上下文中各自记录当前会话"""
+        first = QueryProfiler()
+        second = QueryProfiler()
+
+        with first.profile("outer"):
+            with second.profile("inner"):
+                assert first.current_session_id == "outer"
+                assert second.current_session_id == "inner"
+            assert second.current_session_id is None
+            assert first.current_session_id == "outer"
+
+        assert first.current_session_id is None
+        first.disable()
+        second.disable()
+
 
 class TestPerformanceMonitor:
     """性能监控器测试类"""
@@ -144,7 +185,18 @@ class TestN1Detector:
         
         assert "?" in template  # 参数被替换为占位符
         assert table == "users"
-    
+
+        # 仅字面量不同的SQL归为同一模式
+        other, _ = detector.normalize_sql(
+            "select *  from users where id = 456 /* comment */"
+        )
+        assert other == template
+
+        named, _ = detector.normalize_sql(
+            "SELECT * FROM posts WHERE title = 'abc' AND user_id = %(user_id)s"
+        )
+        assert named == "SELECT * FROM POSTS WHERE TITLE = ? AND USER_ID = ?"
+
     def test_n1_detector_enable_disable(self):
         """测试启用/禁用检测"""
         detector = N1Detector()
@@ -5,9 +5,9 @@ FastORM 关系功能简化测试
 """
 
 import pytest
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Table
 from fastorm.model import Model
-from fastorm.relations import HasOne, BelongsTo
+from fastorm.relations import HasOne, HasMany, BelongsTo, BelongsToMany
 from fastorm.relations.mixins import RelationMixin
 
 class SimpleUser(Model, RelationMixin):
@@ -19,6 +19,13 @@ class SimpleUser(Model, RelationMixin):
     email = Column(String(100), unique=True)
     
     profile = HasOne('SimpleProfile', foreign_key='user_id')
+    profiles = HasMany('SimpleProfile', foreign_key='user_id')
+    roles = BelongsToMany(
+        'SimpleRole',
+        pivot_table='simple_test_user_roles',
+        foreign_key='user_id',
+        related_key='role_id',
+    )
 
 class SimpleProfile(Model, RelationMixin):
     """简单档案模型"""
@@ -30,6 +37,21 @@ class SimpleProfile(Model, RelationMixin):
     
     user = BelongsTo('SimpleUser', foreign_key='user_id')
 
+class SimpleRole(Model, RelationMixin):
+    """简单角色模型"""
+    __tablename__ = 'simple_test_roles'
+    
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), nullable=False)
+
+simple_user_roles = Table(
+    'simple_test_user_roles',
+    Model.metadata,
+    Column('user_id', Integer, ForeignKey('simple_test_users.id'), primary_key=True),
+    Column('role_id', Integer, ForeignKey('simple_test_roles.id'), primary_key=True),
+    Column('level', Integer),
+)
+
 class TestSimpleRelations:
     """简化关系功能测试类"""
     
@@ -92,6 +114,135 @@ class TestSimpleRelations:
         profile = await found_user.profile.load()
         assert profile is None
     
+    @pytest.mark.asyncio
+    async def test_eager_load_single_query(self, test_database, capture_sql):
+        """测试with_预加载每个关系只发出一次查询"""
+        names = ["Eager1", "Eager2", "Eager3"]
+        for name in names:
+            user = SimpleUser(name=name, email=f"{name.lower()}@example.com")
+            await user.save()
+            if name != "Eager3":
+                profile = SimpleProfile(user_id=user.id, bio=f"{name}的简介")
+                await profile.save()
+
+        with capture_sql() as statements:
+            users = await SimpleUser.where('name', 'in', names) \
+                .order_by('name').with_('profile').get()
+
+        profile_queries = [s for s in statements if "simple_test_profiles" in s]
+        assert len(profile_queries) == 1
+
+        assert [u.profile.is_loaded for u in users] == [True, True, True]
+        assert users[0].profile.data.bio == "Eager1的简介"
+        assert users[1].profile.data.bio == "Eager2的简介"
+        assert users[2].profile.data is None
+
+    @pytest.mark.asyncio
+    async def test_has_many_eager_load_single_query(self, test_database, capture_sql):
+        """测试HasMany预加载任意数量父实例只发出一次查询"""
+        counts = {"Many1": 2, "Many2": 1, "Many3": 0}
+        for name, count in counts.items():
+            user = SimpleUser(name=name, email=f"{name.lower()}@example.com")
+            await user.save()
+            for i in range(count):
+                await SimpleProfile(user_id=user.id, bio=f"{name}-{i}").save()
+
+        with capture_sql() as statements:
+            users = await SimpleUser.where('name', 'in', list(counts)) \
+                .order_by('name').with_('profiles').get()
+
+        profile_queries = [s for s in statements if "simple_test_profiles" in s]
+        assert len(profile_queries) == 1
+        assert [len(u.profiles.data) for u in users] == [2, 1, 0]
+
+        # 单个父实例的 load() 走同一条批量查询
+        profiles = await users[0].profiles.load()
+        assert sorted(p.bio for p in profiles) == ["Many1-0", "Many1-1"]
+
+    @pytest.mark.asyncio
+    async def test_belongs_to_many_attach(self, test_database, capture_sql):
+        """测试BelongsToMany批量附加只发出一条INSERT语句"""
+        user = SimpleUser(name="Roles", email="roles@example.com")
+        await user.save()
+        roles = [SimpleRole(name=f"role{i}") for i in range(3)]
+        for role in roles:
+            await role.save()
+
+        with capture_sql() as statements:
+            await user.roles.attach([r.id for r in roles], {'level': 2})
+
+        inserts = [s for s in statements if s.startswith("INSERT")]
+        assert len(inserts) == 1
+
+        # 重复附加被忽略
+        await user.roles.attach(roles[0].id)
+
+        async with test_database.session() as session:
+            result = await session.execute(
+                simple_user_roles.select().order_by('role_id')
+            )
+            rows = [tuple(row) for row in result]
+        assert rows == [(user.id, r.id, 2) for r in roles]
+
+    @pytest.mark.asyncio
+    async def test_belongs_to_many_detach_and_toggle(self, test_database, capture_sql):
+        """测试BelongsToMany中间表操作使用参数化语句并复用编译结果"""
+        user = SimpleUser(name="Detach", email="detach@example.com")
+        await user.save()
+        roles = [SimpleRole(name=f"detach{i}") for i in range(4)]
+        for role in roles:
+            await role.save()
+        role_ids = [r.id for r in roles]
+
+        await user.roles.attach(role_ids)
+        loaded = await user.roles.load()
+        assert sorted(r.id for r in loaded) == role_ids
+
+        compiled_cache = test_database.get_engine().sync_engine._compiled_cache
+        with capture_sql() as statements:
+            await user.roles.detach(role_ids[:2])
+            size = len(compiled_cache)
+            await user.roles.detach([role_ids[2]])
+            assert len(compiled_cache) == size
+
+        assert len(statements) == 2
+        for statement in statements:
+            assert statement.startswith("DELETE FROM simple_test_user_roles WHERE")
+            assert "user_id = ?" in statement
+
+        result = await user.roles.toggle([role_ids[0], role_ids[3]])
+        assert result == {"attached": [role_ids[0]], "detached": [role_ids[3]]}
+        assert [r.id for r in await user.roles.load()] == [role_ids[0]]
+
+        await user.roles.detach()
+        assert await user.roles.load() == []
+
+    def test_belongs_to_many_inferred_names(self):
+        """测试BelongsToMany推断的中间表名和外键名"""
+        relation = BelongsToMany(SimpleRole)
+        user = SimpleUser(name="Infer", email="infer@example.com")
+
+        assert relation.get_pivot_table(user) == "simple_test_roles_simple_test_users"
+        assert relation.get_foreign_key(user) == "simpleuser_id"
+        assert relation.get_related_key() == "simplerole_id"
+        # 推断结果按父模型类缓存
+        assert relation._resolved_pivot_tables == {
+            SimpleUser: "simple_test_roles_simple_test_users"
+        }
+
+    def test_has_many_inferred_foreign_key(self):
+        """测试HasMany推断的外键名和本地键取值"""
+        relation = HasMany(SimpleProfile)
+        user = SimpleUser(id=7, name="Infer", email="infer@example.com")
+
+        assert relation.get_foreign_key(user) == "simpleuser_id"
+        assert relation.get_local_key_value(user) == 7
+        assert relation._resolved_foreign_keys == {SimpleUser: "simpleuser_id"}
+
+        explicit = HasMany(SimpleProfile, foreign_key='user_id')
+        assert explicit.get_foreign_key(user) == "user_id"
+        assert explicit._resolved_foreign_keys == {}
+
     @pytest.mark.asyncio
     async def test_relation_discovery(self, test_database):
         """测试关系自动发现"""
@@ -211,6 +211,16 @@ class TestScopes:
         assert users[0].name == "Alice", "全局作用域排序失效"
         assert users[1].name == "Charlie", "全局作用域排序失效"
 
+    @pytest.mark.asyncio
+    async def test_global_scope_applied_once_when_chaining(self, test_database):
+        """测试链式调用不会重复应用全局作用域"""
+        query = GlobalScopeTestUser.query()
+        base_conditions = len(query._query_builder._conditions)
+
+        chained = query.by_status('active').where('name', 'Alice')
+        assert len(chained._query_builder._conditions) == base_conditions + 2
+        assert chained._applied_global_scopes == query._applied_global_scopes
+
     @pytest.mark.asyncio
     async def test_without_global_scope(self, test_database):
         """测试移除全局作用域"""
@@ -0,0 +1,108 @@
+"""
+FastORM 测试工具测试
+
+测试工厂序列、工厂元类和Seeder元类。
+"""
+
+import pytest
+
+from fastorm.testing import Factory, Seeder, Sequence
+from fastorm.testing.seeder import SeederRegistry
+
+
+class Thing:
+    """工厂测试用的普通模型"""
+
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+class ThingFactory(Factory):
+    """测试工厂"""
+
+    class Meta:
+        model = Thing
+
+    name = "thing"
+    code = Sequence(lambda n: f"code{n}")
+
+    @classmethod
+    def helper(cls):
+        return "helper"
+
+    @staticmethod
+    def util():
+        return "util"
+
+    @property
+    def label(self):
+        return "label"
+
+
+class TestSequence:
+    """工厂序列测试类"""
+
+    def test_sequence_next_and_reset(self):
+        """测试序列递增和重置"""
+        sequence = Sequence(lambda n: f"user{n}", start=5)
+
+        assert [sequence.next() for _ in range(3)] == ["user5", "user6", "user7"]
+
+        sequence.reset()
+        assert sequence.next() == "user5"
+
+        sequence.reset(start=100)
+        assert sequence.next() == "user100"
+
+
+class TestFactoryMetaclass:
+    """工厂元类测试类"""
+
+    def test_factory_methods_not_collected_as_attributes(self):
+        """测试类方法、静态方法和属性不被当作模型字段"""
+        assert ThingFactory._attributes == {"name": "thing"}
+        assert set(ThingFactory._sequences) == {"code"}
+        assert ThingFactory.helper() == "helper"
+        assert ThingFactory.util() == "util"
+
+    @pytest.mark.asyncio
+    async def test_factory_build_batch(self):
+        """测试批量构建时序列依次递增"""
+        ThingFactory._sequences["code"].reset()
+
+        things = await ThingFactory.build_batch(3)
+
+        assert [vars(t) for t in things] == [
+            {"name": "thing", "code": "code1"},
+            {"name": "thing", "code": "code2"},
+            {"name": "thing", "code": "code3"},
+        ]
+
+
+class TestSeederMetaclass:
+    """Seeder元类测试类"""
+
+    @pytest.fixture
+    def clean_registry(self):
+        seeders = SeederRegistry.get_all_seeders()
+        order = SeederRegistry.get_execution_order()
+        yield
+        SeederRegistry._seeders = seeders
+        SeederRegistry._execution_order = order
+
+    def test_seeder_subclass_registered(self, clean_registry):
+        """测试Seeder子类自动注册且保持抽象约束"""
+
+        class ThingSeeder(Seeder):
+            async def run(self):
+                pass
+
+        assert SeederRegistry.get_seeder("ThingSeeder") is ThingSeeder
+        assert "ThingSeeder" in SeederRegistry.get_execution_order()
+
+        # 元类继承自ABCMeta，未实现run的子类不能实例化
+        class IncompleteSeeder(Seeder):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteSeeder()
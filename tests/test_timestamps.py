@@ -55,12 +55,6 @@ class TestTimestamps:
     @pytest.mark.asyncio
     async def test_timestamps_enabled(self, async_session):
         """测试启用时间戳的模型"""
-        # 创建表
-        async with async_session.begin():
-            await async_session.run_sync(
-                lambda sync_session: TimestampEnabledUser.metadata.create_all(sync_session.bind)
-            )
-
         # 测试创建记录
         user = TimestampEnabledUser(name="John", email="john@example.com")
         